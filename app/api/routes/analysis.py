@@ -90,8 +90,11 @@ def find_best_template(contract):
     # Rule 3: Similarity-based matching against all templates
     logger.info("No specific vendor/type match found, using similarity-based matching")
     
+    import difflib
     from ...core.services.comparison_engine import ComparisonEngine
     comparison_engine = ComparisonEngine()
+    # Local to this scan, so the contract's index lives only as long as it
+    matcher = difflib.SequenceMatcher(None)
     
     best_template = None
     best_similarity = 0.0
@@ -99,7 +102,11 @@ def find_best_template(contract):
     for template_file in template_files:
         try:
             template_content = doc_processor.extract_text_from_docx(str(template_file))
-            similarity = comparison_engine.calculate_similarity(contract_content, template_content)
+            # Templates that cannot beat the current best are rejected cheaply;
+            # the contract goes second so its index is built once for all templates
+            similarity = comparison_engine.calculate_similarity(
+                template_content, contract_content, cutoff=best_similarity, matcher=matcher
+            )
             
             logger.debug(f"Template {template_file.name}: similarity = {similarity:.3f}")
             
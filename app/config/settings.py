@@ -74,6 +74,8 @@ class BaseConfig:
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FILE = os.getenv('LOG_FILE', 'output/logs/dashboard.log')
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    # Process-wide: other handlers (e.g. gunicorn's) may format these fields
+    LOG_SKIP_PROCESS_INFO = os.getenv('LOG_SKIP_PROCESS_INFO', 'false').lower() == 'true'
     
     # === ANALYSIS SETTINGS ===
     SIMILARITY_THRESHOLD = float(os.getenv('SIMILARITY_THRESHOLD', '0.5'))
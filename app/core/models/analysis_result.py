@@ -4,8 +4,9 @@ Analysis Result Domain Model
 Represents contract analysis results and change detection.
 """
 
+import functools
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -29,6 +30,18 @@ class ChangeType(Enum):
     REPLACEMENT = "replacement"
 
 
+@functools.lru_cache(maxsize=None)
+def _change_type_from_str(value: str) -> ChangeType:
+    """Convert a serialized change type, memoized per distinct string"""
+    return ChangeType(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _classification_from_str(value: str) -> ChangeClassification:
+    """Convert a serialized classification, memoized per distinct string"""
+    return ChangeClassification(value)
+
+
 @dataclass
 class Change:
     """
@@ -68,13 +81,13 @@ class Change:
         
         if not isinstance(self.change_type, ChangeType):
             if isinstance(self.change_type, str):
-                self.change_type = ChangeType(self.change_type)
+                self.change_type = _change_type_from_str(self.change_type)
             else:
                 raise ValueError("Invalid change type")
         
         if not isinstance(self.classification, ChangeClassification):
             if isinstance(self.classification, str):
-                self.classification = ChangeClassification(self.classification)
+                self.classification = _classification_from_str(self.classification)
             else:
                 raise ValueError("Invalid classification")
     
@@ -125,8 +138,8 @@ class Change:
         """Create change from dictionary"""
         return cls(
             change_id=data["change_id"],
-            change_type=ChangeType(data["change_type"]),
-            classification=ChangeClassification(data["classification"]),
+            change_type=_change_type_from_str(data["change_type"]),
+            classification=_classification_from_str(data["classification"]),
             deleted_text=data.get("deleted_text", ""),
             inserted_text=data.get("inserted_text", ""),
             context_before=data.get("context_before", ""),
@@ -197,6 +210,14 @@ class AnalysisResult:
         # Recalculate risk level
         self.overall_risk_level = self._calculate_risk_level()
     
+    def add_changes(self, changes: Iterable[Change]):
+        """Add several changes, recalculating the risk level once"""
+        self.changes.extend(changes)
+        self.total_changes = len(self.changes)
+        
+        # Recalculate risk level
+        self.overall_risk_level = self._calculate_risk_level()
+    
     def get_critical_changes(self) -> List[Change]:
         """Get all critical changes"""
         return [c for c in self.changes if c.is_critical()]
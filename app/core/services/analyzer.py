@@ -126,29 +126,20 @@ class ContractAnalyzer:
                 llm_model_used=self.llm_provider.model if self.llm_provider else None
             )
             
-            # Step 4: Convert text changes to Change objects
-            changes = []
-            for i, (operation, text) in enumerate(text_changes):
-                change_id = f"{analysis_id}_change_{i+1}"
-                
-                if operation == 'delete':
-                    change = create_change_from_diff(
-                        change_id=change_id,
-                        deleted_text=text,
-                        inserted_text="",
-                        explanation="Text removed from template"
-                    )
-                elif operation == 'insert':
-                    change = create_change_from_diff(
-                        change_id=change_id,
-                        deleted_text="",
-                        inserted_text=text,
-                        explanation="Text added to contract"
+            # Step 4: Convert text changes to Change objects (other operations are skipped)
+            changes = [
+                create_change_from_diff(
+                    change_id=f"{analysis_id}_change_{i}",
+                    deleted_text=text if operation == 'delete' else "",
+                    inserted_text=text if operation == 'insert' else "",
+                    explanation=(
+                        "Text removed from template" if operation == 'delete'
+                        else "Text added to contract"
                     )
-                else:
-                    continue  # Skip other operations
-                
-                changes.append(change)
+                )
+                for i, (operation, text) in enumerate(text_changes, 1)
+                if operation in ('delete', 'insert')
+            ]
             
             # Step 5: LLM Analysis (if enabled and provider available)
             if include_llm_analysis and self.llm_provider:
@@ -164,8 +155,7 @@ class ContractAnalyzer:
                     # Continue with basic analysis
             
             # Step 6: Add changes to analysis result
-            for change in changes:
-                analysis_result.add_change(change)
+            analysis_result.add_changes(changes)
             
             # Step 7: Generate business recommendations
             analysis_result.recommendations = self._generate_recommendations(analysis_result)
@@ -5,12 +5,54 @@ Handles text comparison and change detection algorithms.
 """
 
 import difflib
-from typing import List, Tuple, Dict, Any
+import functools
+from typing import List, Tuple, Dict, Any, Optional
 
 from ...utils.logging.setup import get_logger
+from .myers import myers_opcodes
 
 logger = get_logger(__name__)
 
+# Inputs longer than this many lines try Myers' diff before SequenceMatcher
+_MYERS_MIN_LINES = 2000
+
+# Myers gives up past this edit distance; its cost grows with the square of it
+_MYERS_MAX_EDITS = 200
+
+
+@functools.lru_cache(maxsize=16)
+def _line_opcodes(
+    text1: str, text2: str
+) -> Tuple[List[str], List[str], List[Tuple[str, int, int, int, int]]]:
+    """
+    Split two texts into lines and diff them, memoized per text pair.
+    
+    find_changes and find_detailed_changes share the result, so the same
+    template/contract pair is only diffed once. Callers must not mutate
+    the returned lists.
+    
+    Args:
+        text1: Original text (template)
+        text2: Modified text (contract)
+        
+    Returns:
+        Tuple of (lines1, lines2, opcodes) with opcodes in
+        SequenceMatcher.get_opcodes() format
+    """
+    lines1 = text1.splitlines()
+    lines2 = text2.splitlines()
+    
+    # Long, similar documents diff much faster with Myers' O((N+M)D)
+    # search; fall back to SequenceMatcher when they differ too much
+    opcodes = None
+    if max(len(lines1), len(lines2)) > _MYERS_MIN_LINES:
+        opcodes = myers_opcodes(lines1, lines2, max_edits=_MYERS_MAX_EDITS)
+    if opcodes is None:
+        matcher = difflib.SequenceMatcher(None, lines1, lines2, autojunk=False)
+        opcodes = matcher.get_opcodes()
+    
+    return lines1, lines2, opcodes
+
 
 class ComparisonError(Exception):
     """Exception raised when text comparison fails"""
@@ -26,19 +68,27 @@ class ComparisonEngine:
     - Change detection using difflib
     - Context extraction around changes
     - Change categorization and filtering
+    
+    The engine holds no per-comparison state, so one instance can be shared
+    between threads.
     """
     
     def __init__(self):
         """Initialize comparison engine"""
         logger.debug("Comparison engine initialized")
     
-    def calculate_similarity(self, text1: str, text2: str) -> float:
+    def calculate_similarity(self, text1: str, text2: str, cutoff: float = 0.0, matcher: Optional[difflib.SequenceMatcher] = None) -> float:
         """
         Calculate similarity between two texts using SequenceMatcher.
         
         Args:
             text1: Original text
             text2: Modified text
+            cutoff: Minimum similarity of interest; pairs whose cheap upper
+                bound falls below it return 0.0 without the full comparison
+            matcher: Optional caller-owned SequenceMatcher to reuse when
+                comparing many texts against the same text2, whose index it
+                then builds only once. Must not be shared between threads.
             
         Returns:
             Similarity ratio (0.0 to 1.0)
@@ -50,7 +100,25 @@ class ComparisonEngine:
             if not text1 or not text2:
                 return 0.0  # One empty
             
-            similarity = difflib.SequenceMatcher(None, text1, text2).ratio()
+            if text1 == text2:
+                return 1.0  # Identical
+            
+            # Reject on the length bound before indexing text2, then on the
+            # character-bag bound, before paying for the full ratio
+            len1, len2 = len(text1), len(text2)
+            if 2.0 * min(len1, len2) / (len1 + len2) < cutoff:
+                logger.debug(f"Similarity below cutoff {cutoff:.3f}, skipped full comparison")
+                return 0.0
+            
+            if matcher is None:
+                matcher = difflib.SequenceMatcher(None)
+            matcher.set_seqs(text1, text2)
+            
+            if matcher.quick_ratio() < cutoff:
+                logger.debug(f"Similarity below cutoff {cutoff:.3f}, skipped full comparison")
+                return 0.0
+            
+            similarity = matcher.ratio()
             
             logger.debug(f"Calculated similarity: {similarity:.3f}")
             return similarity
@@ -75,23 +143,15 @@ class ComparisonEngine:
             if not text1 and not text2:
                 return []
             
-            # Use unified diff to find changes
-            differ = difflib.unified_diff(
-                text1.splitlines(keepends=True),
-                text2.splitlines(keepends=True),
-                lineterm='',
-                n=0  # No context lines
-            )
+            lines1, lines2, opcodes = _line_opcodes(text1, text2)
             
+            # Emit deletions/insertions straight from the line opcodes
             changes = []
-            for line in differ:
-                # Skip diff headers
-                if line.startswith('--- ') or line.startswith('+++ ') or line.startswith('@@'):
-                    continue
-                elif line.startswith('-'):
-                    changes.append(('delete', line[1:]))
-                elif line.startswith('+'):
-                    changes.append(('insert', line[1:]))
+            for tag, i1, i2, j1, j2 in opcodes:
+                if tag in ('delete', 'replace'):
+                    changes.extend(('delete', line) for line in lines1[i1:i2])
+                if tag in ('insert', 'replace'):
+                    changes.extend(('insert', line) for line in lines2[j1:j2])
             
             logger.debug(f"Found {len(changes)} changes")
             return changes
@@ -114,50 +174,32 @@ class ComparisonEngine:
         try:
             changes = []
             
-            # Split texts into lines for analysis
-            lines1 = text1.splitlines()
-            lines2 = text2.splitlines()
+            # Line opcodes are shared with find_changes for the same pair
+            lines1, lines2, opcodes = _line_opcodes(text1, text2)
             
-            # Use SequenceMatcher for detailed comparison
-            matcher = difflib.SequenceMatcher(None, lines1, lines2)
+            # Number of context lines kept on each side of a change
+            context_size = 2
+            num_lines1 = len(lines1)
             
-            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            for tag, i1, i2, j1, j2 in opcodes:
                 if tag == 'equal':
                     continue  # No change
                 
-                change = {
+                changes.append({
                     'operation': tag,
                     'original_start': i1,
                     'original_end': i2,
                     'modified_start': j1,
                     'modified_end': j2,
-                    'deleted_text': '',
-                    'inserted_text': '',
-                    'context_before': '',
-                    'context_after': ''
-                }
-                
-                # Extract deleted and inserted text
-                if tag in ['delete', 'replace']:
-                    change['deleted_text'] = '\n'.join(lines1[i1:i2])
-                
-                if tag in ['insert', 'replace']:
-                    change['inserted_text'] = '\n'.join(lines2[j1:j2])
-                
-                # Extract context
-                context_size = 2
-                
-                # Context before
-                if i1 > 0:
-                    context_start = max(0, i1 - context_size)
-                    change['context_before'] = '\n'.join(lines1[context_start:i1])
-                
-                # Context after
-                if i2 < len(lines1):
-                    context_end = min(len(lines1), i2 + context_size)
-                    change['context_after'] = '\n'.join(lines1[i2:context_end])
-                
-                changes.append(change)
+                    'deleted_text': '\n'.join(lines1[i1:i2]) if tag in ('delete', 'replace') else '',
+                    'inserted_text': '\n'.join(lines2[j1:j2]) if tag in ('insert', 'replace') else '',
+                    'context_before': (
+                        '\n'.join(lines1[max(0, i1 - context_size):i1]) if i1 > 0 else ''
+                    ),
+                    'context_after': (
+                        '\n'.join(lines1[i2:i2 + context_size]) if i2 < num_lines1 else ''
+                    )
+                })
             
             logger.debug(f"Found {len(changes)} detailed changes")
             return changes
@@ -182,7 +224,9 @@ class ComparisonEngine:
             words1 = text1.split()
             words2 = text2.split()
             
-            matcher = difflib.SequenceMatcher(None, words1, words2)
+            # Without autojunk, repeated words stay matchable; otherwise a
+            # one-word edit in repetitive text becomes a huge replace
+            matcher = difflib.SequenceMatcher(None, words1, words2, autojunk=False)
             changes = []
             
             for tag, i1, i2, j1, j2 in matcher.get_opcodes():
@@ -226,23 +270,22 @@ class ComparisonEngine:
         """
         try:
             significant_changes = []
+            is_insignificant = self._is_insignificant_change
             
             for change in changes:
                 deleted_text = change.get('deleted_text', '')
                 inserted_text = change.get('inserted_text', '')
                 
-                # Skip if only whitespace changes
-                if ignore_whitespace:
-                    if deleted_text.strip() == '' and inserted_text.strip() == '':
-                        continue
+                # Skip if changes are too small (cheapest check first)
+                if len(deleted_text) + len(inserted_text) < min_length:
+                    continue
                 
-                # Skip if changes are too small
-                total_change_length = len(deleted_text) + len(inserted_text)
-                if total_change_length < min_length:
+                # Skip if only whitespace changes
+                if ignore_whitespace and not deleted_text.strip() and not inserted_text.strip():
                     continue
                 
                 # Skip common insignificant patterns
-                if self._is_insignificant_change(deleted_text, inserted_text):
+                if is_insignificant(deleted_text, inserted_text):
                     continue
                 
                 significant_changes.append(change)
@@ -265,25 +308,23 @@ class ComparisonEngine:
         Returns:
             True if change is insignificant
         """
-        # Common insignificant patterns
-        insignificant_patterns = [
-            # Punctuation changes
-            (deleted_text.strip(' .,;'), inserted_text.strip(' .,;')),
-            # Case changes
-            (deleted_text.lower(), inserted_text.lower()),
-            # Multiple spaces to single space
-            (' '.join(deleted_text.split()), ' '.join(inserted_text.split()))
-        ]
-        
-        for pattern in insignificant_patterns:
-            if pattern[0] == pattern[1]:
-                return True
-        
         # Very short changes (single characters)
         if len(deleted_text) <= 1 and len(inserted_text) <= 1:
             return True
         
-        return False
+        # Common insignificant patterns, checked lazily so that later
+        # normalizations are skipped as soon as one matches
+        
+        # Punctuation changes
+        if deleted_text.strip(' .,;') == inserted_text.strip(' .,;'):
+            return True
+        
+        # Case changes
+        if deleted_text.lower() == inserted_text.lower():
+            return True
+        
+        # Multiple spaces to single space
+        return ' '.join(deleted_text.split()) == ' '.join(inserted_text.split())
     
     def get_change_statistics(self, changes: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -11,11 +11,53 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from docx import Document
+from docx.oxml.ns import qn
 
 from ...utils.logging.setup import get_logger
 
 logger = get_logger(__name__)
 
+# Run content that contributes to paragraph text, in document order; the
+# same elements python-docx 1.x's Paragraph.text reads, including hyperlink runs
+_RUN_CONTENT_XPATH = (
+    "(w:r | w:hyperlink/w:r)/*[self::w:t or self::w:tab or self::w:ptab"
+    " or self::w:br or self::w:cr or self::w:noBreakHyphen]"
+)
+_W_P = qn('w:p')
+_W_T = qn('w:t')
+_W_BR = qn('w:br')
+_W_TYPE = qn('w:type')
+_RUN_CHARS = {
+    qn('w:tab'): '\t',
+    qn('w:ptab'): '\t',
+    qn('w:cr'): '\n',
+    qn('w:noBreakHyphen'): '-',
+}
+
+
+def _paragraph_text(p) -> str:
+    """
+    Text of a <w:p> element, equal to Paragraph(p).text on python-docx 1.x.
+    
+    Reads the run content with one XPath query instead of building Run
+    proxies and querying each run, which dominates extraction time on
+    long documents. python-docx 0.8.x's Paragraph.text differs: it skips
+    runs inside hyperlinks, turns page breaks into newlines and ignores
+    w:ptab and w:noBreakHyphen. This returns the 1.x text on either version.
+    """
+    parts = []
+    for el in p.xpath(_RUN_CONTENT_XPATH):
+        tag = el.tag
+        if tag == _W_T:
+            parts.append(el.text or '')
+        elif tag == _W_BR:
+            # Only line breaks map to text; page and column breaks do not
+            if el.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        else:
+            parts.append(_RUN_CHARS[tag])
+    return ''.join(parts)
+
 
 class DocumentProcessingError(Exception):
     """Exception raised when document processing fails"""
@@ -58,8 +100,8 @@ class DocumentProcessor:
             text_content = []
             
             # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                text_content.append(paragraph.text)
+            for p in doc.element.body.iterchildren(_W_P):
+                text_content.append(_paragraph_text(p))
             
             # Extract text from tables
             for table in doc.tables:
@@ -158,16 +200,9 @@ class DocumentProcessor:
         if not text:
             return ""
         
-        # Basic text cleaning
-        processed_text = text.strip()
-        
-        # Normalize whitespace
-        processed_text = ' '.join(processed_text.split())
-        
-        # Remove excessive line breaks
-        processed_text = processed_text.replace('\n\n\n', '\n\n')
-        
-        return processed_text
+        # Normalize whitespace; split() also drops leading/trailing
+        # whitespace and leaves no line breaks behind
+        return ' '.join(text.split())
     
     def create_commented_docx(
         self,
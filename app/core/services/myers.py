@@ -0,0 +1,132 @@
+"""
+Myers Diff
+
+Shortest edit script between two sequences using Myers' O((N+M)D)
+algorithm, reported as difflib-style opcodes.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+Opcode = Tuple[str, int, int, int, int]
+
+
+def myers_opcodes(
+    a: Sequence, b: Sequence, max_edits: Optional[int] = None
+) -> Optional[List[Opcode]]:
+    """
+    Compute opcodes turning ``a`` into ``b`` with Myers' diff.
+
+    Args:
+        a: Original sequence
+        b: Modified sequence
+        max_edits: Give up once the edit distance exceeds this bound
+
+    Returns:
+        List of (tag, i1, i2, j1, j2) tuples in the format of
+        difflib.SequenceMatcher.get_opcodes(), or None if the edit
+        distance exceeds max_edits
+    """
+    n, m = len(a), len(b)
+
+    # Trim the common prefix and suffix; they never need the search
+    prefix = 0
+    limit = min(n, m)
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and a[n - 1 - suffix] == b[m - 1 - suffix]:
+        suffix += 1
+
+    blocks = _matching_blocks(a[prefix:n - suffix], b[prefix:m - suffix], max_edits)
+    if blocks is None:
+        return None
+
+    blocks = [(i + prefix, j + prefix, size) for i, j, size in blocks]
+    if prefix:
+        blocks.insert(0, (0, 0, prefix))
+    if suffix:
+        blocks.append((n - suffix, m - suffix, suffix))
+
+    return _blocks_to_opcodes(blocks, n, m)
+
+
+def _matching_blocks(
+    a: Sequence, b: Sequence, max_edits: Optional[int]
+) -> Optional[List[Tuple[int, int, int]]]:
+    """Find the (i, j, size) runs of equal elements on a shortest edit path"""
+    n, m = len(a), len(b)
+    if not n or not m:
+        # Only insertions or only deletions remain; still honour the bound
+        if max_edits is not None and n + m > max_edits:
+            return None
+        return []
+
+    max_d = n + m if max_edits is None else min(n + m, max_edits)
+    offset = max_d + 1
+    v = [0] * (2 * max_d + 3)
+    trace = []
+
+    # Forward pass: furthest-reaching x on each diagonal k = x - y
+    for d in range(max_d + 1):
+        trace.append(v[offset - d:offset + d + 1])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _backtrack(trace, n, m)
+
+    return None
+
+
+def _backtrack(trace: List[List[int]], n: int, m: int) -> List[Tuple[int, int, int]]:
+    """Walk the saved diagonals back from (n, m) collecting equal runs"""
+    blocks = []
+    x, y = n, m
+
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v[k - 1 + d] < v[k + 1 + d]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k + d] if d else 0
+        prev_y = prev_x - prev_k if d else 0
+
+        # The snake ends at (x, y); it starts just after the edit from prev
+        start_x = prev_x if d == 0 or prev_k == k + 1 else prev_x + 1
+        run = min(x - start_x, y - (start_x - k))
+        if run > 0:
+            blocks.append((x - run, y - run, run))
+        x, y = prev_x, prev_y
+
+    blocks.reverse()
+    return blocks
+
+
+def _blocks_to_opcodes(blocks: List[Tuple[int, int, int]], n: int, m: int) -> List[Opcode]:
+    """Convert matching blocks to opcodes the way SequenceMatcher does"""
+    opcodes = []
+    i = j = 0
+    for ai, bj, size in blocks + [(n, m, 0)]:
+        if i < ai and j < bj:
+            opcodes.append(('replace', i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(('delete', i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(('insert', i, ai, j, bj))
+        if size:
+            opcodes.append(('equal', ai, ai + size, bj, bj + size))
+        i, j = ai + size, bj + size
+    return opcodes
+
+
+__all__ = ['myers_opcodes']
@@ -5,6 +5,7 @@ Generates professional PDF reports with structured formatting.
 """
 
 import logging
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any
@@ -12,7 +13,7 @@ from typing import Dict, List, Any
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.lib.colors import HexColor, Color
+from reportlab.lib.colors import HexColor, Color, white
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
 
@@ -21,6 +22,100 @@ from ....utils.logging.setup import get_logger
 logger = get_logger(__name__)
 
 
+# Styles are immutable once configured, so they are built once at import
+# and shared by every formatter instance
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Title'],
+    fontSize=18,
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    textColor=HexColor('#1f4788')
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading1'],
+    fontSize=14,
+    spaceBefore=20,
+    spaceAfter=12,
+    textColor=HexColor('#1f4788')
+)
+
+_RISK_STYLES = {
+    'HIGH': ParagraphStyle(
+        'RiskHigh',
+        parent=_STYLES['Normal'],
+        fontSize=12,
+        textColor=HexColor('#cc0000'),
+        fontName='Helvetica-Bold'
+    ),
+    'MEDIUM': ParagraphStyle(
+        'RiskMedium',
+        parent=_STYLES['Normal'],
+        fontSize=12,
+        textColor=HexColor('#ff6600'),
+        fontName='Helvetica-Bold'
+    ),
+    'LOW': ParagraphStyle(
+        'RiskLow',
+        parent=_STYLES['Normal'],
+        fontSize=12,
+        textColor=HexColor('#008000'),
+        fontName='Helvetica-Bold'
+    )
+}
+
+_RECOMMENDATION_STYLE = ParagraphStyle(
+    'Recommendation',
+    parent=_STYLES['Normal'],
+    spaceAfter=6
+)
+
+# Section tables carry their own heading in a spanned first row, so a
+# section is a single flowable instead of heading + spacers + table
+_SECTION_HEADER_COMMANDS = [
+    ('SPAN', (0, 0), (-1, 0)),
+    ('BACKGROUND', (0, 0), (-1, 0), HexColor('#1f4788')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 14),
+    ('LEADING', (0, 0), (-1, 0), 17),
+    ('TOPPADDING', (0, 0), (-1, 0), 6)
+]
+
+_EXEC_TABLE_STYLE = TableStyle(_SECTION_HEADER_COMMANDS + [
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ('GRID', (0, 1), (-1, -1), 1, HexColor('#cccccc'))
+])
+
+# Rows: heading, risk level, explanation, then the classification breakdown
+_RISK_TABLE_STYLE = TableStyle(_SECTION_HEADER_COMMANDS + [
+    ('SPAN', (0, 1), (-1, 1)),
+    ('SPAN', (0, 2), (-1, 2)),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 3), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 3), (-1, -1), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 3), (-1, -1), 1, HexColor('#cccccc'))
+])
+
+_CHANGES_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, HexColor('#cccccc')),
+    ('BACKGROUND', (0, 0), (-1, 0), HexColor('#f0f0f0'))
+])
+
+
 class PDFReportFormatter:
     """
     PDF report formatter for contract analysis results.
@@ -34,58 +129,10 @@ class PDFReportFormatter:
     
     def __init__(self):
         """Initialize PDF formatter"""
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
-        
-        # Title style
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Title'],
-            fontSize=18,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=HexColor('#1f4788')
-        )
-        
-        # Heading style
-        self.heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=self.styles['Heading1'],
-            fontSize=14,
-            spaceBefore=20,
-            spaceAfter=12,
-            textColor=HexColor('#1f4788')
-        )
-        
-        # Risk high style
-        self.risk_high_style = ParagraphStyle(
-            'RiskHigh',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            textColor=HexColor('#cc0000'),
-            fontName='Helvetica-Bold'
-        )
-        
-        # Risk medium style
-        self.risk_medium_style = ParagraphStyle(
-            'RiskMedium',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            textColor=HexColor('#ff6600'),
-            fontName='Helvetica-Bold'
-        )
-        
-        # Risk low style
-        self.risk_low_style = ParagraphStyle(
-            'RiskLow',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            textColor=HexColor('#008000'),
-            fontName='Helvetica-Bold'
-        )
+        self.styles = _STYLES
+        self.title_style = _TITLE_STYLE
+        self.heading_style = _HEADING_STYLE
+        self.risk_styles = _RISK_STYLES
     
     def generate_summary_report(self, analysis_data: Dict[str, Any], output_path: str) -> str:
         """
@@ -104,29 +151,28 @@ class PDFReportFormatter:
         doc = SimpleDocTemplate(output_path, pagesize=letter)
         story = []
         
+        # Count classifications once for every section that needs them
+        cls_counts = Counter(
+            c.get('classification', 'UNKNOWN') for c in analysis_data.get('analysis', [])
+        )
+        
         # Title
         title = Paragraph("Contract Analysis Report", self.title_style)
         story.append(title)
-        story.append(Spacer(1, 20))
         
         # Executive Summary
-        story.append(Paragraph("Executive Summary", self.heading_style))
         self._add_executive_summary(story, analysis_data)
-        story.append(Spacer(1, 20))
         
         # Risk Assessment
-        story.append(Paragraph("Risk Assessment", self.heading_style))
-        self._add_risk_assessment(story, analysis_data)
-        story.append(Spacer(1, 20))
+        self._add_risk_assessment(story, analysis_data, cls_counts)
         
-        # Changes Summary
+        # Changes Summary (heading style provides the gap between sections)
         story.append(Paragraph("Changes Summary", self.heading_style))
         self._add_changes_summary(story, analysis_data)
-        story.append(Spacer(1, 20))
         
         # Recommendations
         story.append(Paragraph("Recommendations", self.heading_style))
-        self._add_recommendations(story, analysis_data)
+        self._add_recommendations(story, analysis_data, cls_counts)
         
         # Build PDF
         doc.build(story)
@@ -138,6 +184,7 @@ class PDFReportFormatter:
         """Add executive summary to the story"""
         
         summary_data = [
+            ['Executive Summary', ''],
             ['Contract:', analysis_data.get('contract', 'Unknown')],
             ['Template:', analysis_data.get('template', 'Unknown')],
             ['Analysis Date:', analysis_data.get('date', datetime.now().strftime('%Y-%m-%d'))],
@@ -146,62 +193,33 @@ class PDFReportFormatter:
             ['Status:', analysis_data.get('status', 'Completed')]
         ]
         
-        table = Table(summary_data, colWidths=[2*inch, 4*inch])
-        table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, HexColor('#cccccc'))
-        ]))
+        table = Table(summary_data, colWidths=[2*inch, 4*inch], spaceBefore=20)
+        table.setStyle(_EXEC_TABLE_STYLE)
         
         story.append(table)
     
-    def _add_risk_assessment(self, story: List, analysis_data: Dict[str, Any]):
+    def _add_risk_assessment(self, story: List, analysis_data: Dict[str, Any], cls_counts: Counter):
         """Add risk assessment to the story"""
         
-        risk_level = self._determine_risk_level(analysis_data)
-        risk_explanation = self._get_risk_explanation(risk_level, analysis_data)
-        
-        # Risk level with appropriate styling
-        if risk_level == "HIGH":
-            risk_para = Paragraph(f"Overall Risk Level: {risk_level}", self.risk_high_style)
-        elif risk_level == "MEDIUM":
-            risk_para = Paragraph(f"Overall Risk Level: {risk_level}", self.risk_medium_style)
-        else:
-            risk_para = Paragraph(f"Overall Risk Level: {risk_level}", self.risk_low_style)
-        
-        story.append(risk_para)
-        story.append(Spacer(1, 12))
-        
-        # Risk explanation
-        explanation_para = Paragraph(risk_explanation, self.styles['Normal'])
-        story.append(explanation_para)
-        
-        # Risk breakdown
-        changes = analysis_data.get('analysis', [])
-        critical_count = len([c for c in changes if c.get('classification') == 'CRITICAL'])
-        significant_count = len([c for c in changes if c.get('classification') == 'SIGNIFICANT'])
-        inconsequential_count = len([c for c in changes if c.get('classification') == 'INCONSEQUENTIAL'])
-        
-        breakdown_data = [
-            ['Critical Changes:', str(critical_count)],
-            ['Significant Changes:', str(significant_count)],
-            ['Inconsequential Changes:', str(inconsequential_count)]
+        risk_level = self._determine_risk_level(cls_counts)
+        risk_explanation = self._get_risk_explanation(risk_level, cls_counts)
+        
+        risk_data = [
+            ['Risk Assessment', ''],
+            # Risk level with appropriate styling
+            [Paragraph(f"Overall Risk Level: {risk_level}", self.risk_styles[risk_level]), ''],
+            # Risk explanation
+            [Paragraph(risk_explanation, self.styles['Normal']), ''],
+            # Risk breakdown
+            ['Critical Changes:', str(cls_counts['CRITICAL'])],
+            ['Significant Changes:', str(cls_counts['SIGNIFICANT'])],
+            ['Inconsequential Changes:', str(cls_counts['INCONSEQUENTIAL'])]
         ]
         
-        breakdown_table = Table(breakdown_data, colWidths=[2*inch, 1*inch])
-        breakdown_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, HexColor('#cccccc'))
-        ]))
-        
-        story.append(Spacer(1, 12))
-        story.append(breakdown_table)
+        risk_table = Table(risk_data, colWidths=[2*inch, 4*inch], spaceBefore=20)
+        risk_table.setStyle(_RISK_TABLE_STYLE)
+        
+        story.append(risk_table)
     
     def _add_changes_summary(self, story: List, analysis_data: Dict[str, Any]):
         """Add changes summary table to the story"""
@@ -228,14 +246,7 @@ class PDFReportFormatter:
             ])
         
         table = Table(table_data, colWidths=[0.5*inch, 1.5*inch, 4*inch])
-        table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, HexColor('#cccccc')),
-            ('BACKGROUND', (0, 0), (-1, 0), HexColor('#f0f0f0'))
-        ]))
+        table.setStyle(_CHANGES_TABLE_STYLE)
         
         story.append(table)
         
@@ -243,26 +254,21 @@ class PDFReportFormatter:
             story.append(Spacer(1, 12))
             story.append(Paragraph(f"... and {len(changes) - 10} more changes. See detailed report for complete analysis.", self.styles['Italic']))
     
-    def _add_recommendations(self, story: List, analysis_data: Dict[str, Any]):
+    def _add_recommendations(self, story: List, analysis_data: Dict[str, Any], cls_counts: Counter):
         """Add recommendations to the story"""
         
-        recommendations = self._generate_recommendations(analysis_data)
+        recommendations = self._generate_recommendations(analysis_data, cls_counts)
         
         if recommendations:
             for rec in recommendations:
-                # Clean emoji for PDF
-                clean_rec = rec.replace('🚨', '• CRITICAL:').replace('⚠️', '• WARNING:').replace('✅', '• APPROVED:').replace('📋', '• NOTE:')
-                rec_para = Paragraph(clean_rec, self.styles['Normal'])
-                story.append(rec_para)
-                story.append(Spacer(1, 6))
+                story.append(Paragraph(rec, _RECOMMENDATION_STYLE))
         else:
             story.append(Paragraph("No specific recommendations at this time.", self.styles['Normal']))
     
-    def _determine_risk_level(self, analysis_data: Dict[str, Any]) -> str:
+    def _determine_risk_level(self, cls_counts: Counter) -> str:
         """Determine overall risk level"""
-        changes = analysis_data.get('analysis', [])
-        critical_count = len([c for c in changes if c.get('classification') == 'CRITICAL'])
-        significant_count = len([c for c in changes if c.get('classification') == 'SIGNIFICANT'])
+        critical_count = cls_counts['CRITICAL']
+        significant_count = cls_counts['SIGNIFICANT']
         
         if critical_count > 0:
             return "HIGH"
@@ -273,10 +279,9 @@ class PDFReportFormatter:
         else:
             return "LOW"
     
-    def _get_risk_explanation(self, risk_level: str, analysis_data: Dict[str, Any]) -> str:
+    def _get_risk_explanation(self, risk_level: str, cls_counts: Counter) -> str:
         """Get explanation for risk level"""
-        changes = analysis_data.get('analysis', [])
-        critical_count = len([c for c in changes if c.get('classification') == 'CRITICAL'])
+        critical_count = cls_counts['CRITICAL']
         
         if risk_level == "HIGH":
             if critical_count > 0:
@@ -288,38 +293,36 @@ class PDFReportFormatter:
         else:
             return "This contract has minimal changes (mostly placeholder content) and can proceed through standard review processes."
     
-    def _generate_recommendations(self, analysis_data: Dict[str, Any]) -> List[str]:
+    def _generate_recommendations(self, analysis_data: Dict[str, Any], cls_counts: Counter) -> List[str]:
         """Generate recommendations based on analysis"""
         recommendations = []
         
-        changes = analysis_data.get('analysis', [])
-        critical_changes = [c for c in changes if c.get('classification') == 'CRITICAL']
-        risk_level = self._determine_risk_level(analysis_data)
+        risk_level = self._determine_risk_level(cls_counts)
         
         if risk_level == "HIGH":
             recommendations.extend([
-                "🚨 CRITICAL: Schedule immediate legal review with qualified counsel",
-                "🚨 Do not execute contract until all critical changes are approved",
-                "🚨 Focus on value-to-value changes (price, service, company modifications)"
+                "• CRITICAL: Schedule immediate legal review with qualified counsel",
+                "• CRITICAL: Do not execute contract until all critical changes are approved",
+                "• CRITICAL: Focus on value-to-value changes (price, service, company modifications)"
             ])
         elif risk_level == "MEDIUM":
             recommendations.extend([
-                "⚠️ Schedule legal review before contract execution",
-                "⚠️ Review all significant changes with stakeholders",
-                "⚠️ Verify pricing and service level changes"
+                "• WARNING: Schedule legal review before contract execution",
+                "• WARNING: Review all significant changes with stakeholders",
+                "• WARNING: Verify pricing and service level changes"
             ])
         else:
             recommendations.extend([
-                "✅ Contract may proceed through standard review process",
-                "✅ Verify placeholder content has been properly filled",
-                "✅ Confirm standard terms and conditions"
+                "• APPROVED: Contract may proceed through standard review process",
+                "• APPROVED: Verify placeholder content has been properly filled",
+                "• APPROVED: Confirm standard terms and conditions"
             ])
         
         # Add general recommendations
         recommendations.extend([
-            "📋 Document all approved changes for future reference",
-            "📋 Ensure all parties acknowledge the modifications",
-            "📋 Update contract management system with new terms"
+            "• NOTE: Document all approved changes for future reference",
+            "• NOTE: Ensure all parties acknowledge the modifications",
+            "• NOTE: Update contract management system with new terms"
         ])
         
         return recommendations
@@ -4,16 +4,107 @@ File Manager for Storage Operations
 Handles file operations, cleanup, and storage management.
 """
 
+import errno
+import fnmatch
+import functools
 import logging
+import math
+import operator
+import os
+import re
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Callable, Tuple
 
 from ...utils.logging.setup import get_logger
 
 logger = get_logger(__name__)
 
+# Scanning by directory descriptor lets stat/unlink resolve entry names
+# relative to it instead of walking the full path each time (not on Windows)
+_HAS_DIR_FD = os.scandir in os.supports_fd and os.unlink in os.supports_dir_fd
+
+# link() failures that mean "hard links are not possible here" rather than a real error
+_LINK_UNSUPPORTED_ERRNOS = (errno.EXDEV, errno.EPERM, errno.ENOTSUP)
+
+_GLOB_MAGIC = re.compile(r'[*?[]')
+
+# Upper bound on concurrent archive moves; each worker holds at most two
+# file descriptors open at a time
+_ARCHIVE_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _compile_file_patterns(file_patterns: List[str]) -> Callable[[str], bool]:
+    """
+    Build a single file name matcher for a list of glob patterns
+    
+    Plain '*.ext' patterns collapse into one str.endswith() over a tuple of
+    suffixes; any other patterns are combined into one compiled regex.
+    Matching is case-sensitive, like glob() on POSIX.
+    
+    Args:
+        file_patterns: Glob patterns such as ['*.xlsx', 'report_*.pdf']
+        
+    Returns:
+        Predicate taking a file name
+    """
+    suffixes = []
+    other_patterns = []
+    for pattern in file_patterns:
+        if pattern.startswith('*') and not _GLOB_MAGIC.search(pattern, 1):
+            suffixes.append(pattern[1:])
+        else:
+            other_patterns.append(fnmatch.translate(pattern))
+    
+    suffixes = tuple(suffixes)
+    if not other_patterns:
+        return lambda name: name.endswith(suffixes)
+    
+    combined = re.compile('|'.join(other_patterns))
+    return lambda name: name.endswith(suffixes) or combined.match(name) is not None
+
+
+def _file_extension(name: str) -> str:
+    """
+    Lowercased extension of a file name, matching Path(name).suffix.lower()
+    
+    Slices the name directly instead of building a Path for every entry.
+    """
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot:].lower()
+    return ''
+
+
+@functools.lru_cache(maxsize=4096)
+def _isoformat_seconds(seconds: int) -> str:
+    """ISO 8601 local time for a whole-second timestamp"""
+    return datetime.fromtimestamp(seconds).isoformat()
+
+
+def _isoformat_timestamp(timestamp: float) -> str:
+    """
+    Format a timestamp like datetime.fromtimestamp(timestamp).isoformat()
+    
+    Files in one listing mostly share a handful of seconds, so the
+    whole-second part is cached and only the microseconds are appended.
+    """
+    frac, seconds = math.modf(timestamp)
+    micros = round(frac * 1e6)
+    if micros >= 1000000:
+        seconds += 1
+        micros -= 1000000
+    elif micros < 0:
+        seconds -= 1
+        micros += 1000000
+    
+    formatted = _isoformat_seconds(int(seconds))
+    return f"{formatted}.{micros:06d}" if micros else formatted
+
 
 class FileManagerError(Exception):
     """Exception raised when file management operations fail"""
@@ -41,7 +132,11 @@ class FileManager:
         self.base_directory = Path(base_directory)
         self.base_directory.mkdir(parents=True, exist_ok=True)
         
-        logger.debug(f"File manager initialized for: {self.base_directory}")
+        # Resolved once; the trailing separator keeps /a/bc from matching base /a/b
+        self._abs_base = os.path.realpath(self.base_directory)
+        self._abs_base_prefix = os.path.join(self._abs_base, '')
+        
+        logger.debug("File manager initialized for: %s", self.base_directory)
     
     def cleanup_old_files(self, max_age_days: int = 30, file_patterns: List[str] = None) -> int:
         """
@@ -57,26 +152,31 @@ class FileManager:
         if file_patterns is None:
             file_patterns = ['*.xlsx', '*.docx', '*.pdf']
         
-        cutoff_date = datetime.now() - timedelta(days=max_age_days)
+        cutoff_ts = (datetime.now() - timedelta(days=max_age_days)).timestamp()
+        matches_pattern = _compile_file_patterns(file_patterns)
         cleanup_count = 0
         
-        logger.info(f"Starting cleanup of files older than {max_age_days} days")
+        logger.info("Starting cleanup of files older than %s days", max_age_days)
         
         try:
-            for pattern in file_patterns:
-                for file_path in self.base_directory.glob(pattern):
+            # Single directory pass; DirEntry caches the file type and stat result
+            with self._open_directory(self.base_directory) as dir_fd, \
+                    os.scandir(self.base_directory if dir_fd is None else dir_fd) as entries:
+                for entry in entries:
+                    if not matches_pattern(entry.name):
+                        continue
+                    
                     try:
-                        file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                        
-                        if file_mtime < cutoff_date:
-                            logger.debug(f"Removing old file: {file_path.name}")
-                            file_path.unlink()
+                        if entry.is_file() and entry.stat().st_mtime < cutoff_ts:
+                            logger.debug("Removing old file: %s", entry.name)
+                            # entry.path is relative to dir_fd when scanning by descriptor
+                            os.unlink(entry.path, dir_fd=dir_fd)
                             cleanup_count += 1
                             
                     except Exception as e:
-                        logger.warning(f"Failed to process file {file_path}: {e}")
+                        logger.warning("Failed to process file %s: %s", entry.name, e)
             
-            logger.info(f"Cleanup completed - Removed {cleanup_count} files")
+            logger.info("Cleanup completed - Removed %s files", cleanup_count)
             return cleanup_count
             
         except Exception as e:
@@ -93,10 +193,9 @@ class FileManager:
             total_size = 0
             file_count = 0
             
-            for file_path in self.base_directory.rglob('*'):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
-                    file_count += 1
+            for _, size in self.iter_file_sizes():
+                total_size += size
+                file_count += 1
             
             return {
                 'total_size_bytes': total_size,
@@ -108,6 +207,60 @@ class FileManager:
         except Exception as e:
             raise FileManagerError(f"Failed to calculate directory size: {e}")
     
+    def iter_file_sizes(self) -> Iterator[Tuple[str, int]]:
+        """
+        Walk the base directory and yield file sizes as they are found
+        
+        Lets callers report progress on large trees instead of waiting for
+        get_directory_size() to finish the whole walk.
+        
+        Yields:
+            (file path, size in bytes) for each file under the base directory
+        """
+        # Walk with scandir so each entry costs at most one stat and no Path objects
+        pending = [str(self.base_directory)]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                # Unreadable or vanished directories are skipped, as rglob() does
+                continue
+            
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        try:
+                            size = entry.stat().st_size
+                        except OSError:
+                            continue
+                        yield entry.path, size
+    
+    def get_disk_usage(self) -> Dict[str, Any]:
+        """
+        Get usage of the filesystem holding the base directory
+        
+        A single statvfs-style call with no directory walk, for callers that
+        only need a rough picture of available space.
+        
+        Returns:
+            Dictionary with filesystem size information
+        """
+        try:
+            usage = shutil.disk_usage(self.base_directory)
+            
+            return {
+                'total_bytes': usage.total,
+                'used_bytes': usage.used,
+                'free_bytes': usage.free,
+                'free_mb': round(usage.free / (1024 * 1024), 2),
+                'directory': str(self.base_directory)
+            }
+            
+        except Exception as e:
+            raise FileManagerError(f"Failed to get disk usage: {e}")
+    
     def list_files_by_type(self, file_extension: str = None) -> List[Dict[str, Any]]:
         """
         List files by type with metadata
@@ -118,29 +271,42 @@ class FileManager:
         Returns:
             List of file metadata dictionaries
         """
-        files = []
+        matches = []
         
         try:
-            pattern = f"*{file_extension}" if file_extension else "*"
+            suffix = file_extension or ''
             
-            for file_path in self.base_directory.glob(pattern):
-                if file_path.is_file():
-                    stat = file_path.stat()
+            with os.scandir(self.base_directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(suffix):
+                        continue
                     
-                    files.append({
-                        'name': file_path.name,
-                        'path': str(file_path),
-                        'size_bytes': stat.st_size,
-                        'size_mb': round(stat.st_size / (1024 * 1024), 3),
-                        'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                        'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        'extension': file_path.suffix.lower()
-                    })
-            
-            # Sort by modification time (newest first)
-            files.sort(key=lambda x: x['modified'], reverse=True)
-            
-            return files
+                    # One stat per entry; its mode doubles as the regular-file check.
+                    # Dangling symlinks and entries removed mid-scan are skipped.
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    if not stat.S_ISREG(st.st_mode):
+                        continue
+                    
+                    matches.append((st.st_mtime, entry.name, entry.path, st))
+            
+            # Sort by raw modification time (newest first), then format the timestamps
+            matches.sort(key=operator.itemgetter(0), reverse=True)
+            
+            return [
+                {
+                    'name': name,
+                    'path': path,
+                    'size_bytes': st.st_size,
+                    'size_mb': round(st.st_size / (1024 * 1024), 3),
+                    'created': _isoformat_timestamp(st.st_ctime),
+                    'modified': _isoformat_timestamp(mtime),
+                    'extension': _file_extension(name)
+                }
+                for mtime, name, path, st in matches
+            ]
             
         except Exception as e:
             raise FileManagerError(f"Failed to list files: {e}")
@@ -164,14 +330,14 @@ class FileManager:
             
             if path.exists() and path.is_file():
                 path.unlink()
-                logger.info(f"File deleted: {path.name}")
+                logger.info("File deleted: %s", path.name)
                 return True
             else:
-                logger.warning(f"File not found: {file_path}")
+                logger.warning("File not found: %s", file_path)
                 return False
                 
         except Exception as e:
-            logger.error(f"Failed to delete file {file_path}: {e}")
+            logger.error("Failed to delete file %s: %s", file_path, e)
             return False
     
     def safe_move_file(self, source_path: str, destination_path: str) -> bool:
@@ -180,7 +346,8 @@ class FileManager:
         
         Args:
             source_path: Source file path
-            destination_path: Destination file path
+            destination_path: Destination file path, or an existing directory
+                to move the file into (as shutil.move does)
             
         Returns:
             True if move was successful
@@ -196,17 +363,31 @@ class FileManager:
             if not source.exists():
                 raise FileManagerError(f"Source file not found: {source_path}")
             
+            # os.replace() would fail on or replace a directory; move into it
+            # instead, refusing to overwrite a file of the same name there
+            if destination.is_dir():
+                destination = destination / source.name
+                if destination.exists():
+                    raise FileManagerError(f"Destination path already exists: {destination}")
+            
             # Create destination directory if needed
             destination.parent.mkdir(parents=True, exist_ok=True)
             
-            # Move file
-            shutil.move(str(source), str(destination))
-            logger.info(f"File moved: {source.name} -> {destination}")
+            # Same-filesystem moves are a single atomic rename; copy only across devices
+            try:
+                os.replace(source, destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.copy2(source, destination)
+                os.unlink(source)
+            
+            logger.info("File moved: %s -> %s", source.name, destination)
             
             return True
             
         except Exception as e:
-            logger.error(f"Failed to move file {source_path} -> {destination_path}: {e}")
+            logger.error("Failed to move file %s -> %s: %s", source_path, destination_path, e)
             return False
     
     def get_file_metadata(self, file_path: str) -> Optional[Dict[str, Any]]:
@@ -222,26 +403,30 @@ class FileManager:
         try:
             path = Path(file_path)
             
-            if not path.exists() or not path.is_file():
+            # A single stat answers existence, file type, size, times and mode
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 return None
             
-            stat = path.stat()
+            if not stat.S_ISREG(st.st_mode):
+                return None
             
             return {
                 'name': path.name,
                 'path': str(path.resolve()),
-                'size_bytes': stat.st_size,
-                'size_mb': round(stat.st_size / (1024 * 1024), 3),
-                'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                'extension': path.suffix.lower(),
+                'size_bytes': st.st_size,
+                'size_mb': round(st.st_size / (1024 * 1024), 3),
+                'created': _isoformat_timestamp(st.st_ctime),
+                'modified': _isoformat_timestamp(st.st_mtime),
+                'extension': _file_extension(path.name),
                 'parent_directory': str(path.parent),
-                'is_readable': path.is_file() and path.stat().st_mode & 0o444,
-                'is_writable': path.is_file() and path.stat().st_mode & 0o222
+                'is_readable': bool(st.st_mode & 0o444),
+                'is_writable': bool(st.st_mode & 0o222)
             }
             
         except Exception as e:
-            logger.error(f"Failed to get metadata for {file_path}: {e}")
+            logger.error("Failed to get metadata for %s: %s", file_path, e)
             return None
     
     def archive_old_files(self, archive_directory: str, max_age_days: int = 90) -> int:
@@ -258,41 +443,148 @@ class FileManager:
         archive_path = Path(archive_directory)
         archive_path.mkdir(parents=True, exist_ok=True)
         
-        cutoff_date = datetime.now() - timedelta(days=max_age_days)
+        cutoff_ts = (datetime.now() - timedelta(days=max_age_days)).timestamp()
         archive_count = 0
         
-        logger.info(f"Starting archival of files older than {max_age_days} days")
+        logger.info("Starting archival of files older than %s days", max_age_days)
         
         try:
-            for file_path in self.base_directory.glob('*'):
-                if file_path.is_file():
+            with self._open_directory(self.base_directory) as src_fd, \
+                    self._open_directory(archive_path) as dst_fd, \
+                    os.scandir(self.base_directory if src_fd is None else src_fd) as entries:
+                candidates = []
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    
                     try:
-                        file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                        
-                        if file_mtime < cutoff_date:
-                            destination = archive_path / file_path.name
-                            
-                            # Handle name conflicts
-                            counter = 1
-                            while destination.exists():
-                                stem = file_path.stem
-                                suffix = file_path.suffix
-                                destination = archive_path / f"{stem}_{counter}{suffix}"
-                                counter += 1
-                            
-                            shutil.move(str(file_path), str(destination))
-                            logger.debug(f"Archived file: {file_path.name} -> {destination.name}")
-                            archive_count += 1
-                            
+                        if entry.stat().st_mtime < cutoff_ts:
+                            candidates.append((entry.name, entry.is_symlink()))
+                    except Exception as e:
+                        logger.warning("Failed to archive file %s: %s", entry.name, e)
+                
+                # Moves are independent of each other, so run them concurrently
+                # while the directory descriptors are still open
+                def archive(candidate):
+                    name, is_symlink = candidate
+                    try:
+                        archived_name = self._archive_entry(
+                            name, archive_path, src_fd, dst_fd, is_symlink
+                        )
+                        logger.debug("Archived file: %s -> %s", name, archived_name)
+                        return True
                     except Exception as e:
-                        logger.warning(f"Failed to archive file {file_path}: {e}")
+                        logger.warning("Failed to archive file %s: %s", name, e)
+                        return False
+                
+                if len(candidates) > 1:
+                    with ThreadPoolExecutor(max_workers=_ARCHIVE_MAX_WORKERS) as executor:
+                        archive_count = sum(executor.map(archive, candidates))
+                else:
+                    archive_count = sum(map(archive, candidates))
             
-            logger.info(f"Archive completed - Moved {archive_count} files")
+            logger.info("Archive completed - Moved %s files", archive_count)
             return archive_count
             
         except Exception as e:
             raise FileManagerError(f"Archive operation failed: {e}")
     
+    def _archive_entry(
+        self,
+        name: str,
+        archive_path: Path,
+        src_fd: Optional[int],
+        dst_fd: Optional[int],
+        is_symlink: bool = False
+    ) -> str:
+        """
+        Move a single file from the base directory into the archive
+        
+        The file is hard-linked under the first free name and then unlinked,
+        so an existing name is reported by the link itself instead of being
+        probed with exists(). Where hard links are not possible (e.g. the
+        archive is on another device) the file is copied to an exclusively
+        created destination instead. A symlink is archived as the link
+        itself, recreated in the archive, and its target is left in place.
+        Every path claims the name atomically, so concurrent archive
+        workers never pick the same conflict suffix.
+        
+        Args:
+            name: File name within the base directory
+            archive_path: Archive directory
+            src_fd: Base directory descriptor, or None for path-based calls
+            dst_fd: Archive directory descriptor, or None for path-based calls
+            is_symlink: Whether the entry is a symbolic link
+            
+        Returns:
+            Name the file was archived under
+        """
+        source = name if src_fd is not None else os.path.join(self.base_directory, name)
+        stem, suffix = os.path.splitext(name)
+        counter = 0
+        candidate = name
+        use_copy = False
+        link_target = os.readlink(source, dir_fd=src_fd) if is_symlink else None
+        
+        while True:
+            target = candidate if dst_fd is not None else os.path.join(archive_path, candidate)
+            try:
+                if link_target is not None:
+                    # Move the link, not its target, as a rename would
+                    os.symlink(link_target, target, dir_fd=dst_fd)
+                elif use_copy:
+                    self._copy_to_new_file(
+                        os.path.join(self.base_directory, name),
+                        os.path.join(archive_path, candidate)
+                    )
+                else:
+                    os.link(source, target, src_dir_fd=src_fd, dst_dir_fd=dst_fd)
+                break
+            except FileExistsError:
+                counter += 1
+                candidate = f"{stem}_{counter}{suffix}"
+            except OSError as e:
+                if use_copy or e.errno not in _LINK_UNSUPPORTED_ERRNOS:
+                    raise
+                use_copy = True
+        
+        os.unlink(source, dir_fd=src_fd)
+        return candidate
+    
+    @staticmethod
+    def _copy_to_new_file(source: str, destination: str):
+        """Copy a file with metadata, failing if the destination already exists"""
+        with open(source, 'rb') as src, open(destination, 'xb') as dst:
+            try:
+                shutil.copyfileobj(src, dst)
+            except BaseException:
+                # Do not leave a partial copy claiming the archive name
+                dst.close()
+                os.unlink(destination)
+                raise
+        shutil.copystat(source, destination)
+    
+    @contextmanager
+    def _open_directory(self, directory: Path) -> Iterator[Optional[int]]:
+        """
+        Open a directory for descriptor-relative operations
+        
+        Args:
+            directory: Directory to open
+            
+        Yields:
+            Directory file descriptor, or None if the platform lacks dir_fd support
+        """
+        if not _HAS_DIR_FD:
+            yield None
+            return
+        
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC)
+        try:
+            yield dir_fd
+        finally:
+            os.close(dir_fd)
+    
     def _is_path_safe(self, path: Path) -> bool:
         """
         Check if a path is safe (within base directory)
@@ -304,12 +596,10 @@ class FileManager:
             True if path is safe
         """
         try:
-            # Resolve both paths to absolute paths
-            abs_path = path.resolve()
-            abs_base = self.base_directory.resolve()
+            abs_path = os.path.realpath(path)
             
-            # Check if the path is within the base directory
-            return str(abs_path).startswith(str(abs_base))
+            # Check if the path is the base directory or inside it
+            return abs_path == self._abs_base or abs_path.startswith(self._abs_base_prefix)
             
         except Exception:
             return False
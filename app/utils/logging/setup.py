@@ -4,11 +4,187 @@ Logging configuration for Contract Analyzer
 Provides centralized logging setup with environment-specific configurations.
 """
 
+import atexit
+import copy
+import functools
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
+import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+
+# Loggers that follow the configured application log level
+_APP_LOGGERS = ('', 'app', 'app.services.llm', 'app.core', 'app.api')
+
+# Static logging configuration, built once at import. setup_logging() fills
+# in the configured level, format and file name on a deep copy, because
+# dictConfig() mutates the dictionary it is given.
+_LOGGING_CONFIG_TEMPLATE = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'standard': {
+            'format': None
+        },
+        'detailed': {
+            'format': '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
+        }
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'level': None,
+            'formatter': 'standard',
+            'stream': 'ext://sys.stdout'
+        },
+        'file': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'level': None,
+            'formatter': 'detailed',
+            'filename': None,
+            'maxBytes': 10485760,  # 10MB
+            'backupCount': 5,
+            'encoding': 'utf8'
+        },
+        'error_file': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'level': 'ERROR',
+            'formatter': 'detailed',
+            'filename': None,
+            'maxBytes': 10485760,  # 10MB
+            'backupCount': 3,
+            'encoding': 'utf8'
+        }
+    },
+    'loggers': {
+        **{
+            name: {
+                'level': None,
+                'handlers': ['console', 'file'],
+                'propagate': False
+            }
+            for name in _APP_LOGGERS
+        },
+        'security_audit': {
+            'level': 'INFO',
+            'handlers': ['file'],
+            'propagate': False
+        },
+        'werkzeug': {
+            'level': 'INFO',
+            'handlers': ['console'],
+            'propagate': False
+        },
+        'urllib3': {
+            'level': 'WARNING',
+            'handlers': ['console'],
+            'propagate': False
+        },
+        'requests': {
+            'level': 'WARNING',
+            'handlers': ['console'],
+            'propagate': False
+        }
+    }
+}
+
+# Per-record lookups the logging module makes only while the flag is set,
+# with the LogRecord fields that need them. The flags are process-wide, so
+# they are only cleared when LOG_SKIP_PROCESS_INFO opts in.
+_RECORD_FIELD_FLAGS = {
+    'logThreads': ('%(thread)', '%(threadName)'),
+    'logProcesses': ('%(process)',),
+    'logMultiprocessing': ('%(processName)',),
+}
+
+# Listeners draining the queued file handlers, one per file handler. They
+# are per process: a forked worker gets its own listeners (see below).
+_queue_listeners: List[logging.handlers.QueueListener] = []
+
+# QueueHandlers feeding _queue_listeners, index for index
+_queue_handlers: List[logging.handlers.QueueHandler] = []
+
+
+def _stop_queue_listeners() -> None:
+    """Flush pending records and stop the file handler listener threads"""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+        _queue_handlers.pop()
+
+
+def _restart_queue_listeners() -> None:
+    """
+    Start new listener threads in a forked child
+    
+    Only the forking thread survives fork(), so without this the child's
+    records would pile up in its copy of the queue and never be written,
+    e.g. in gunicorn workers forked after a --preload create_app().
+    """
+    for index, old in enumerate(_queue_listeners):
+        # The inherited queue may have been mid-get() in the parent's
+        # listener thread, so start over with an empty one; records queued
+        # before the fork are written by the parent
+        record_queue = queue.SimpleQueue()
+        _queue_handlers[index].queue = record_queue
+        
+        listener = logging.handlers.QueueListener(
+            record_queue, *old.handlers, respect_handler_level=old.respect_handler_level
+        )
+        listener.start()
+        _queue_listeners[index] = listener
+
+
+atexit.register(_stop_queue_listeners)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_queue_listeners)
+
+
+def _queue_file_handlers(logger_names) -> None:
+    """
+    Move file handler I/O onto background listener threads
+    
+    Each file handler attached to the given loggers is swapped for a
+    QueueHandler, so logging calls only enqueue the record and a single
+    QueueListener per file does the formatting, writing and rotation.
+    
+    This serializes rotation between the threads of one process only.
+    Workers of a multi-process server (e.g. gunicorn -w 4) each keep their
+    own listener and handle on the same file, so rotation can still race
+    across processes; that is out of scope here. Give each worker its own
+    LOG_FILE, or log to the console, when running several workers.
+    
+    Args:
+        logger_names: Names of the configured loggers
+    """
+    proxies = {}
+    
+    for name in logger_names:
+        logger = logging.getLogger(name)
+        for handler in list(logger.handlers):
+            if not isinstance(handler, logging.FileHandler):
+                continue
+            
+            proxy = proxies.get(handler)
+            if proxy is None:
+                record_queue = queue.SimpleQueue()
+                proxy = logging.handlers.QueueHandler(record_queue)
+                # Drop records the file handler would reject before enqueueing
+                proxy.setLevel(handler.level)
+                proxies[handler] = proxy
+                
+                listener = logging.handlers.QueueListener(
+                    record_queue, handler, respect_handler_level=True
+                )
+                listener.start()
+                _queue_listeners.append(listener)
+                _queue_handlers.append(proxy)
+            
+            logger.removeHandler(handler)
+            logger.addHandler(proxy)
 
 
 def setup_logging(config) -> None:
@@ -27,125 +203,63 @@ def setup_logging(config) -> None:
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Logging configuration
-    logging_config = {
-        'version': 1,
-        'disable_existing_loggers': False,
-        'formatters': {
-            'standard': {
-                'format': log_format
-            },
-            'detailed': {
-                'format': '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
-            },
-            'json': {
-                'format': '%(asctime)s %(name)s %(levelname)s %(message)s',
-                'class': 'pythonjsonlogger.jsonlogger.JsonFormatter'
-            }
-        },
-        'handlers': {
-            'console': {
-                'class': 'logging.StreamHandler',
-                'level': log_level,
-                'formatter': 'standard',
-                'stream': 'ext://sys.stdout'
-            },
-            'file': {
-                'class': 'logging.handlers.RotatingFileHandler',
-                'level': log_level,
-                'formatter': 'detailed',
-                'filename': log_file,
-                'maxBytes': 10485760,  # 10MB
-                'backupCount': 5,
-                'encoding': 'utf8'
-            },
-            'error_file': {
-                'class': 'logging.handlers.RotatingFileHandler',
-                'level': 'ERROR',
-                'formatter': 'detailed',
-                'filename': log_file.replace('.log', '_errors.log'),
-                'maxBytes': 10485760,  # 10MB
-                'backupCount': 3,
-                'encoding': 'utf8'
-            }
-        },
-        'loggers': {
-            '': {  # Root logger
-                'level': log_level,
-                'handlers': ['console', 'file'],
-                'propagate': False
-            },
-            'app': {
-                'level': log_level,
-                'handlers': ['console', 'file'],
-                'propagate': False
-            },
-            'app.services.llm': {
-                'level': log_level,
-                'handlers': ['console', 'file'],
-                'propagate': False
-            },
-            'app.core': {
-                'level': log_level,
-                'handlers': ['console', 'file'],
-                'propagate': False
-            },
-            'app.api': {
-                'level': log_level,
-                'handlers': ['console', 'file'],
-                'propagate': False
-            },
-            'security_audit': {
-                'level': 'INFO',
-                'handlers': ['file'],
-                'propagate': False
-            },
-            'werkzeug': {
-                'level': 'WARNING' if config.ENV == 'production' else 'INFO',
-                'handlers': ['console'],
-                'propagate': False
-            },
-            'urllib3': {
-                'level': 'WARNING',
-                'handlers': ['console'],
-                'propagate': False
-            },
-            'requests': {
-                'level': 'WARNING',
-                'handlers': ['console'],
-                'propagate': False
-            }
-        }
-    }
+    # Overlay the configured values on a fresh copy of the template
+    logging_config = copy.deepcopy(_LOGGING_CONFIG_TEMPLATE)
+    handlers = logging_config['handlers']
+    loggers = logging_config['loggers']
+    
+    logging_config['formatters']['standard']['format'] = log_format
+    handlers['console']['level'] = log_level
+    handlers['file']['level'] = log_level
+    handlers['file']['filename'] = log_file
+    handlers['error_file']['filename'] = log_file.replace('.log', '_errors.log')
+    for name in _APP_LOGGERS:
+        loggers[name]['level'] = log_level
+    
+    # Optionally skip thread/process lookups on every record unless one of
+    # our formats shows them; any other handler formatting these fields
+    # (e.g. gunicorn's '[%(process)d]') would then fail on the None values
+    if getattr(config, 'LOG_SKIP_PROCESS_INFO', False):
+        formats = [formatter['format'] for formatter in logging_config['formatters'].values()]
+        for flag, fields in _RECORD_FIELD_FLAGS.items():
+            setattr(logging, flag, any(field in fmt for fmt in formats for field in fields))
     
     # Apply environment-specific modifications
     if config.ENV == 'production':
         # Production: Only file logging, higher thresholds
-        logging_config['handlers']['console']['level'] = 'WARNING'
-        logging_config['loggers']['']['handlers'] = ['file', 'error_file']
+        handlers['console']['level'] = 'WARNING'
+        loggers['']['handlers'] = ['file', 'error_file']
+        loggers['werkzeug']['level'] = 'WARNING'
         
     elif config.ENV == 'testing':
         # Testing: Console only, suppress most output
-        logging_config['handlers']['console']['level'] = 'ERROR'
-        logging_config['loggers']['']['handlers'] = ['console']
+        handlers['console']['level'] = 'ERROR'
+        loggers['']['handlers'] = ['console']
         
         # Suppress third-party logging in tests
-        logging_config['loggers']['werkzeug']['level'] = 'ERROR'
-        logging_config['loggers']['urllib3']['level'] = 'ERROR'
-        logging_config['loggers']['requests']['level'] = 'ERROR'
+        loggers['werkzeug']['level'] = 'ERROR'
+        loggers['urllib3']['level'] = 'ERROR'
+        loggers['requests']['level'] = 'ERROR'
     
-    # Apply configuration
+    # Apply configuration; listeners from a previous call must be drained
+    # before dictConfig closes their handlers
+    _stop_queue_listeners()
     logging.config.dictConfig(logging_config)
+    _queue_file_handlers(loggers)
     
     # Log startup message
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging configured - Environment: {config.ENV}, Level: {log_level}")
+    logger.info("Logging configured - Environment: %s, Level: %s", config.ENV, log_level)
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the given name
     
+    Loggers are singletons per name, so the result is cached to skip the
+    logging module lock on repeated lookups.
+    
     Args:
         name: Logger name (usually __name__)
         
@@ -164,23 +278,28 @@ def log_performance(func):
         def my_function():
             pass
     """
-    import functools
-    import time
+    # Resolved once at decoration time; the wrapper only reads closure cells
+    logger = logging.getLogger(func.__module__)
+    is_enabled_for = logger.isEnabledFor
+    func_name = func.__name__
+    perf_counter_ns = time.perf_counter_ns
     
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(func.__module__)
-        start_time = time.time()
+        start_ns = perf_counter_ns()
         
         try:
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
-            logger.debug(f"{func.__name__} executed in {execution_time:.3f}s")
-            return result
         except Exception as e:
-            execution_time = time.time() - start_time
-            logger.error(f"{func.__name__} failed after {execution_time:.3f}s: {e}")
+            execution_time = (perf_counter_ns() - start_ns) / 1e9
+            logger.error("%s failed after %.3fs: %s", func_name, execution_time, e)
             raise
+        
+        # Only format the timing message when it will actually be emitted
+        if is_enabled_for(logging.DEBUG):
+            execution_time = (perf_counter_ns() - start_ns) / 1e9
+            logger.debug("%s executed in %.3fs", func_name, execution_time)
+        return result
     
     return wrapper
 
@@ -194,16 +313,15 @@ def log_exception(func):
         def my_function():
             pass
     """
-    import functools
+    logger = logging.getLogger(func.__module__)
+    func_name = func.__name__
     
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(func.__module__)
-        
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.exception(f"Exception in {func.__name__}: {e}")
+            logger.exception("Exception in %s: %s", func_name, e)
             raise
     
     return wrapper
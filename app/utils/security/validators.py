@@ -4,26 +4,60 @@ Security validation and sanitization utilities for Contract Analyzer
 Provides comprehensive input validation, file security checks, and audit logging.
 """
 
+import functools
 import os
 import re
 import mimetypes
 import hashlib
 import logging
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
-from werkzeug.utils import secure_filename
-from werkzeug.datastructures import FileStorage
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Tuple
 
-try:
-    import magic
-    HAS_MAGIC = True
-except ImportError:
-    HAS_MAGIC = False
-    magic = None
+# werkzeug and python-magic are imported where they are used, so modules that
+# only need the exception classes do not pay for loading them
+if TYPE_CHECKING:
+    from werkzeug.datastructures import FileStorage
+
+# hashlib.file_digest (Python 3.11+) runs the read/update loop in C
+HAS_FILE_DIGEST = hasattr(hashlib, 'file_digest')
+
+# Read size for the fallback hashing loop
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Leading bytes read once per upload for MIME sniffing and hashing
+_MIME_SNIFF_SIZE = 1024
+
+# Control characters removed from user input, except tab, newline and
+# carriage return, as a str.translate() deletion table
+_CONTROL_CHARS_TABLE = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), *range(0x7F, 0xA0)]
+)
+
+# Input sanitization patterns, compiled once
+_SCRIPT_TAG_RE = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+_SQL_INJECTION_RES = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        r"'[^']*'",  # Single quotes
+        r'"[^"]*"',  # Double quotes
+        r'--.*$',    # SQL comments
+        r'/\*.*?\*/',  # Block comments
+    )
+]
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_magic():
+    """Import python-magic on first use; None when it or libmagic is missing"""
+    try:
+        import magic
+    except ImportError:
+        return None
+    return magic
+
+
 class SecurityError(Exception):
     """Base security validation error"""
     pass
@@ -73,34 +107,41 @@ class SecurityValidator:
             r'[\\/]\.\.$',  # Path traversal at end
             r'[<>:"|?*]',  # Windows forbidden characters
             r'[\x00-\x1f\x7f-\x9f]',  # Control characters
-            r'^\.',  # Hidden files (starting with dot)
-            r'^\s',  # Leading whitespace
-            r'\s$',  # Trailing whitespace
         ]
         
-        # Suspicious filename patterns
-        self.suspicious_patterns = [
-            r'\.exe$',  # Executable files
-            r'\.bat$',  # Batch files
-            r'\.cmd$',  # Command files
-            r'\.com$',  # COM files
-            r'\.scr$',  # Screen saver files
-            r'\.pif$',  # Program information files
-            r'\.vbs$',  # VB Script files
-            r'\.js$',   # JavaScript files
-            r'\.jar$',  # Java archives
-            r'\.php$',  # PHP files
-            r'\.asp$',  # ASP files
-            r'\.jsp$',  # JSP files
-        ]
+        # Suspicious file extensions (lowercase, without the dot)
+        self.suspicious_extensions = frozenset({
+            'exe',  # Executable files
+            'bat',  # Batch files
+            'cmd',  # Command files
+            'com',  # COM files
+            'scr',  # Screen saver files
+            'pif',  # Program information files
+            'vbs',  # VB Script files
+            'js',   # JavaScript files
+            'jar',  # Java archives
+            'php',  # PHP files
+            'asp',  # ASP files
+            'jsp',  # JSP files
+        })
+        
+        # Resolved base directories for validate_path, keyed as passed in
+        self._resolved_bases: Dict[str, Path] = {}
+        
+        # Compiled once into a single alternation, so validate_filename
+        # does one search for every upload. None of the patterns contain
+        # letters, so no case folding is needed.
+        self._dangerous_re = re.compile(
+            '|'.join(f'(?:{p})' for p in self.dangerous_patterns)
+        )
         
         # Expected MIME types for allowed extensions
         self.expected_mime_types = {
-            'docx': [
+            'docx': frozenset({
                 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
                 'application/octet-stream',
                 'application/zip',
-            ]
+            })
         }
         
         logger.info("Security validator initialized")
@@ -115,6 +156,21 @@ class SecurityValidator:
         Returns:
             Sanitized filename
             
+        Raises:
+            FileValidationError: If filename fails validation
+        """
+        return self._validate_filename(filename)[0]
+    
+    def _validate_filename(self, filename: str) -> Tuple[str, str]:
+        """
+        Validate and sanitize filename, also returning its parsed extension
+        
+        Args:
+            filename: Original filename
+            
+        Returns:
+            Tuple of (sanitized filename, lowercase extension)
+            
         Raises:
             FileValidationError: If filename fails validation
         """
@@ -125,40 +181,57 @@ class SecurityValidator:
         if len(filename) > self.max_filename_length:
             raise FileValidationError(f"Filename too long (max {self.max_filename_length} characters)")
         
-        # Check for dangerous patterns
-        if self.path_traversal_protection:
-            for pattern in self.dangerous_patterns:
-                if re.search(pattern, filename, re.IGNORECASE):
-                    raise FileValidationError(f"Filename contains dangerous pattern: {filename}")
+        # Check for dangerous patterns; hidden files (leading dot) and
+        # leading/trailing whitespace only need a look at the end characters
+        if self.path_traversal_protection and (
+            filename[0] == '.'
+            or filename[0].isspace()
+            or filename[-1].isspace()
+            or self._dangerous_re.search(filename)
+        ):
+            raise FileValidationError(f"Filename contains dangerous pattern: {filename}")
         
-        # Check for suspicious patterns
-        for pattern in self.suspicious_patterns:
-            if re.search(pattern, filename, re.IGNORECASE):
-                raise FileValidationError(f"Filename has suspicious extension: {filename}")
+        # Parse the extension once for both extension checks
+        _, dot, extension = filename.rpartition('.')
+        extension = extension.lower()
+        
+        # Check for suspicious extensions
+        if dot and extension in self.suspicious_extensions:
+            raise FileValidationError(f"Filename has suspicious extension: {filename}")
         
         # Check file extension
-        if '.' not in filename:
+        if not dot:
             raise FileValidationError("Filename must have an extension")
         
-        extension = filename.rsplit('.', 1)[1].lower()
         if extension not in self.allowed_extensions:
             raise FileValidationError(f"File extension '{extension}' not allowed")
         
         # Sanitize filename if enabled
         if self.secure_filename_enabled:
+            from werkzeug.utils import secure_filename
+            
             sanitized = secure_filename(filename)
             if not sanitized:
                 raise FileValidationError("Filename could not be sanitized")
-            return sanitized
+            return sanitized, extension
         
-        return filename
+        return filename, extension
     
-    def validate_file_content(self, file_storage: FileStorage) -> Dict[str, Any]:
+    def validate_file_content(
+        self,
+        file_storage: 'FileStorage',
+        compute_hash: bool = True,
+        compute_mime: bool = True
+    ) -> Dict[str, Any]:
         """
         Validate file content and metadata
         
         Args:
             file_storage: Uploaded file object
+            compute_hash: Whether to hash the content; callers that hash the
+                file themselves can skip this full pass ('file_hash' is None)
+            compute_mime: Whether to detect and check the MIME type; skipped
+                checks leave 'mime_type' as None
             
         Returns:
             Validation results dictionary
@@ -180,21 +253,25 @@ class SecurityValidator:
         if file_size == 0:
             raise FileValidationError("File is empty")
         
-        # Validate filename
-        validated_filename = self.validate_filename(file_storage.filename)
+        # Validate filename and get the extension it was validated with
+        validated_filename, extension = self._validate_filename(file_storage.filename)
         
-        # Get file extension
-        extension = validated_filename.rsplit('.', 1)[1].lower() if '.' in validated_filename else ''
+        # Read the start of the file once for MIME sniffing and hashing
+        head = file_storage.read(_MIME_SNIFF_SIZE)
         
         # Validate MIME type if enabled
         detected_mime = None
-        if self.content_type_validation:
-            detected_mime = self._detect_mime_type(file_storage)
+        if self.content_type_validation and compute_mime:
+            detected_mime = self._detect_mime_type(file_storage, head)
             if not self._is_mime_type_allowed(detected_mime, extension):
                 raise FileValidationError(f"MIME type '{detected_mime}' not allowed for extension '{extension}'")
         
         # Calculate file hash for integrity
-        file_hash = self._calculate_file_hash(file_storage)
+        if compute_hash:
+            file_hash = self._calculate_file_hash(file_storage, head)
+        else:
+            file_hash = None
+            file_storage.seek(0)
         
         return {
             'original_filename': file_storage.filename,
@@ -225,12 +302,17 @@ class SecurityValidator:
             return file_path
         
         try:
-            # Resolve paths to absolute
-            base_path = Path(base_directory).resolve()
+            # Resolve paths to absolute; base directories are fixed upload and
+            # storage folders, so each is only resolved once
+            base_path = self._resolved_bases.get(base_directory)
+            if base_path is None:
+                base_path = Path(base_directory).resolve()
+                self._resolved_bases[base_directory] = base_path
             target_path = Path(base_directory, file_path).resolve()
             
-            # Check if target path is within base directory
-            if not str(target_path).startswith(str(base_path)):
+            # Check if target path is within base directory, comparing whole
+            # path components so /a/bc does not count as inside /a/b
+            if not target_path.is_relative_to(base_path):
                 raise PathTraversalError(f"Path traversal detected: {file_path}")
             
             return str(target_path)
@@ -259,33 +341,24 @@ class SecurityValidator:
             raise ContentValidationError(f"Input too long (max {max_length} characters)")
         
         # Remove control characters except newlines and tabs
-        sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]', '', user_input)
+        sanitized = user_input.translate(_CONTROL_CHARS_TABLE)
         
         # Remove potential script tags
-        sanitized = re.sub(r'<script[^>]*>.*?</script>', '', sanitized, flags=re.IGNORECASE | re.DOTALL)
+        sanitized = _SCRIPT_TAG_RE.sub('', sanitized)
         
         # Remove potential SQL injection patterns
-        sql_patterns = [
-            r"'[^']*'",  # Single quotes
-            r'"[^"]*"',  # Double quotes
-            r'--.*$',    # SQL comments
-            r'/\*.*?\*/',  # Block comments
-        ]
-        
-        for pattern in sql_patterns:
-            sanitized = re.sub(pattern, '', sanitized, flags=re.IGNORECASE | re.MULTILINE)
+        for pattern_re in _SQL_INJECTION_RES:
+            sanitized = pattern_re.sub('', sanitized)
         
         return sanitized.strip()
     
-    def _detect_mime_type(self, file_storage: FileStorage) -> str:
-        """Detect MIME type of uploaded file"""
+    def _detect_mime_type(self, file_storage: 'FileStorage', head: bytes) -> str:
+        """Detect MIME type of uploaded file from its leading bytes"""
         try:
-            if HAS_MAGIC:
+            magic = _load_magic()
+            if magic is not None:
                 # Use python-magic for accurate detection
-                file_storage.seek(0)
-                file_data = file_storage.read(1024)  # Read first 1KB
-                file_storage.seek(0)
-                return magic.from_buffer(file_data, mime=True)
+                return magic.from_buffer(head, mime=True)
             else:
                 # Fallback to built-in mimetypes
                 mime_type, _ = mimetypes.guess_type(file_storage.filename)
@@ -296,21 +369,44 @@ class SecurityValidator:
     
     def _is_mime_type_allowed(self, mime_type: str, extension: str) -> bool:
         """Check if MIME type is allowed for given extension"""
-        if extension not in self.expected_mime_types:
+        expected_types = self.expected_mime_types.get(extension)
+        if expected_types is None:
             return True  # No specific MIME type restrictions
         
-        expected_types = self.expected_mime_types[extension]
         return mime_type in expected_types
     
-    def _calculate_file_hash(self, file_storage: FileStorage) -> str:
-        """Calculate SHA-256 hash of file content"""
+    def _calculate_file_hash(self, file_storage: 'FileStorage', head: bytes = b"") -> str:
+        """Calculate SHA-256 hash of file content, given its already-read leading bytes"""
         try:
-            file_storage.seek(0)
-            hasher = hashlib.sha256()
+            hasher = None
+            if HAS_FILE_DIGEST:
+                file_storage.seek(0)
+                try:
+                    hasher = hashlib.file_digest(file_storage.stream, 'sha256')
+                except (ValueError, TypeError, AttributeError):
+                    # file_digest() only accepts binary streams with readinto()
+                    # or getbuffer(); hash anything else with the chunked loop
+                    hasher = None
             
-            # Read file in chunks to handle large files
-            for chunk in iter(lambda: file_storage.read(8192), b""):
-                hasher.update(chunk)
+            if hasher is None:
+                # Continue after the leading bytes instead of reading them again
+                file_storage.seek(len(head))
+                hasher = hashlib.sha256(head)
+                stream = file_storage.stream
+                
+                # Read file in chunks to handle large files, reusing one
+                # buffer when the stream supports readinto()
+                if hasattr(stream, 'readinto'):
+                    buffer = bytearray(_HASH_CHUNK_SIZE)
+                    view = memoryview(buffer)
+                    while True:
+                        size = stream.readinto(buffer)
+                        if not size:
+                            break
+                        hasher.update(view[:size])
+                else:
+                    for chunk in iter(lambda: stream.read(_HASH_CHUNK_SIZE), b""):
+                        hasher.update(chunk)
             
             file_storage.seek(0)  # Reset position
             return hasher.hexdigest()
@@ -319,25 +415,39 @@ class SecurityValidator:
             return ""
 
 
-# Create default validator instance
-default_validator = SecurityValidator()
+# Default validator instance, created on first use so that importing this
+# module does not load the configuration or compile patterns
+@functools.lru_cache(maxsize=None)
+def get_default_validator() -> SecurityValidator:
+    """Get the shared default validator"""
+    return SecurityValidator()
+
+def __getattr__(name: str):
+    """Resolve default_validator lazily for existing module attribute access"""
+    if name == 'default_validator':
+        return get_default_validator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Convenience functions
 def validate_filename(filename: str) -> str:
     """Validate filename using default validator"""
-    return default_validator.validate_filename(filename)
+    return get_default_validator().validate_filename(filename)
 
-def validate_file_content(file_storage: FileStorage) -> Dict[str, Any]:
+def validate_file_content(
+    file_storage: 'FileStorage',
+    compute_hash: bool = True,
+    compute_mime: bool = True
+) -> Dict[str, Any]:
     """Validate file content using default validator"""
-    return default_validator.validate_file_content(file_storage)
+    return get_default_validator().validate_file_content(file_storage, compute_hash, compute_mime)
 
 def validate_path(file_path: str, base_directory: str) -> str:
     """Validate file path using default validator"""
-    return default_validator.validate_path(file_path, base_directory)
+    return get_default_validator().validate_path(file_path, base_directory)
 
 def sanitize_input(user_input: str, max_length: int = 1000) -> str:
     """Sanitize user input using default validator"""
-    return default_validator.sanitize_input(user_input, max_length)
+    return get_default_validator().sanitize_input(user_input, max_length)
 
 
 __all__ = [
@@ -347,6 +457,7 @@ __all__ = [
     'PathTraversalError',
     'ContentValidationError',
     'default_validator',
+    'get_default_validator',
     'validate_filename',
     'validate_file_content',
     'validate_path',
@@ -14,11 +14,27 @@ import os
 from pathlib import Path
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add the project root to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Concurrent analysis requests; the server analyzes each one independently
+MAX_WORKERS = 8
+
+
+def _analyze_one(session, base_url, contract):
+    """Request analysis of one contract and return the parsed response"""
+    response = session.post(
+        f"{base_url}/analyze-contract",
+        json={'contract_id': contract['id']},
+        timeout=60
+    )
+    response.raise_for_status()
+    return response.json()
+
+
 def analyze_all_contracts():
     """Analyze all contracts via the API and display results"""
     
@@ -29,88 +45,92 @@ def analyze_all_contracts():
     print("=" * 80)
     print()
     
-    # Get all contracts
-    try:
-        contracts_response = requests.get(f"{base_url}/contracts")
-        contracts_response.raise_for_status()
-        contracts_data = contracts_response.json()
-        contracts = contracts_data.get('contracts', [])
-    except Exception as e:
-        print(f"❌ Error getting contracts: {e}")
-        return
-    
-    print(f"📋 Found {len(contracts)} contracts to analyze")
-    print()
-    
-    results = []
-    
-    for i, contract in enumerate(contracts, 1):
-        contract_id = contract['id']
-        contract_name = contract['filename']
+    # One pooled session for every request, so the listing call and the
+    # analysis calls share keep-alive connections
+    with requests.Session() as session:
+        # Get all contracts
+        try:
+            contracts_response = session.get(f"{base_url}/contracts")
+            contracts_response.raise_for_status()
+            contracts_data = contracts_response.json()
+            contracts = contracts_data.get('contracts', [])
+        except Exception as e:
+            print(f"❌ Error getting contracts: {e}")
+            return
         
-        print(f"🔍 Analyzing {i}/{len(contracts)}: {contract_name}")
-        print(f"   Contract ID: {contract_id}")
+        print(f"📋 Found {len(contracts)} contracts to analyze")
+        print()
         
-        # Analyze the contract
-        try:
-            analyze_response = requests.post(
-                f"{base_url}/analyze-contract",
-                json={'contract_id': contract_id},
-                timeout=60
-            )
-            analyze_response.raise_for_status()
-            result = analyze_response.json()
+        results = []
+        
+        # Analysis calls are independent and I/O bound, so issue them concurrently
+        # and report them in contract order as they finish
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(_analyze_one, session, base_url, contract)
+                for contract in contracts
+            ]
             
-            if result.get('success'):
-                analysis = result['result']
-                
-                # Extract key information
-                template_used = analysis.get('template', 'Unknown')
-                similarity = analysis.get('similarity', 0)
-                changes = analysis.get('changes', 0)
-                status = analysis.get('status', 'Unknown')
-                
-                print(f"   ✅ Template Selected: {template_used}")
-                print(f"   📊 Similarity: {similarity}%")
-                print(f"   📝 Changes: {changes}")
-                print(f"   ⚠️  Status: {status}")
-                
-                # Determine template selection method
-                if 'Capgemini' in contract_name and 'CAPGEMINI' in template_used:
-                    selection_method = "🎯 Vendor Match (Capgemini)"
-                elif 'BlueOptima' in contract_name and 'BLUEOPTIMA' in template_used:
-                    selection_method = "🎯 Vendor Match (Blue Optima)"
-                elif 'EPAM' in contract_name and 'EPAM' in template_used:
-                    selection_method = "🎯 Vendor Match (EPAM)"
-                elif 'ChangeOrder' in contract_name and 'CHANGEORDER' in template_used:
-                    selection_method = "📄 Document Type Match (Change Order)"
-                elif 'SOW' in contract_name and 'SOW' in template_used:
-                    selection_method = "📄 Document Type Match (SOW)"
-                else:
-                    selection_method = "🔍 Similarity-Based Match"
+            for i, (contract, future) in enumerate(zip(contracts, futures), 1):
+                contract_id = contract['id']
+                contract_name = contract['filename']
                 
-                print(f"   🧠 Selection Method: {selection_method}")
+                print(f"🔍 Analyzing {i}/{len(contracts)}: {contract_name}")
+                print(f"   Contract ID: {contract_id}")
                 
-                # Store result
-                results.append({
-                    'contract': contract_name,
-                    'template': template_used,
-                    'similarity': similarity,
-                    'changes': changes,
-                    'status': status,
-                    'selection_method': selection_method
-                })
+                try:
+                    result = future.result()
+                    
+                    if result.get('success'):
+                        analysis = result['result']
+                        
+                        # Extract key information
+                        template_used = analysis.get('template', 'Unknown')
+                        similarity = analysis.get('similarity', 0)
+                        changes = analysis.get('changes', 0)
+                        status = analysis.get('status', 'Unknown')
+                        
+                        print(f"   ✅ Template Selected: {template_used}")
+                        print(f"   📊 Similarity: {similarity}%")
+                        print(f"   📝 Changes: {changes}")
+                        print(f"   ⚠️  Status: {status}")
+                        
+                        # Determine template selection method
+                        if 'Capgemini' in contract_name and 'CAPGEMINI' in template_used:
+                            selection_method = "🎯 Vendor Match (Capgemini)"
+                        elif 'BlueOptima' in contract_name and 'BLUEOPTIMA' in template_used:
+                            selection_method = "🎯 Vendor Match (Blue Optima)"
+                        elif 'EPAM' in contract_name and 'EPAM' in template_used:
+                            selection_method = "🎯 Vendor Match (EPAM)"
+                        elif 'ChangeOrder' in contract_name and 'CHANGEORDER' in template_used:
+                            selection_method = "📄 Document Type Match (Change Order)"
+                        elif 'SOW' in contract_name and 'SOW' in template_used:
+                            selection_method = "📄 Document Type Match (SOW)"
+                        else:
+                            selection_method = "🔍 Similarity-Based Match"
+                        
+                        print(f"   🧠 Selection Method: {selection_method}")
+                        
+                        # Store result
+                        results.append({
+                            'contract': contract_name,
+                            'template': template_used,
+                            'similarity': similarity,
+                            'changes': changes,
+                            'status': status,
+                            'selection_method': selection_method
+                        })
+                        
+                        print("   ✅ Analysis completed successfully")
+                        
+                    else:
+                        print(f"   ❌ Analysis failed: {result.get('error', 'Unknown error')}")
+                        
+                except Exception as e:
+                    print(f"   ❌ Error analyzing contract: {e}")
                 
-                print("   ✅ Analysis completed successfully")
-                
-            else:
-                print(f"   ❌ Analysis failed: {result.get('error', 'Unknown error')}")
-                
-        except Exception as e:
-            print(f"   ❌ Error analyzing contract: {e}")
+                print()
         
-        print()
-    
     # Display summary
     print("=" * 80)
     print("ANALYSIS SUMMARY")
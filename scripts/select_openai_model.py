@@ -6,7 +6,8 @@ Helps users choose the right OpenAI model for their contract analysis needs
 
 import os
 import sys
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -14,20 +15,27 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from llm_providers import OpenAIProvider
 from config import config
 
-def print_welcome():
-    """Print welcome message and instructions"""
-    print("🤖 OpenAI Model Selection Tool")
-    print("=" * 50)
-    print("This tool helps you choose the right OpenAI model for contract analysis.")
-    print("Each model has different strengths, costs, and performance characteristics.")
-    print()
+class MockProvider:
+    """Offline stand-in that serves the static model table"""
+    AVAILABLE_MODELS = OpenAIProvider.AVAILABLE_MODELS
+    
+    def get_available_models(self):
+        models = []
+        for model_key, model_info in self.AVAILABLE_MODELS.items():
+            models.append({
+                'name': model_info['name'],
+                'description': model_info['description'],
+                'context_window': model_info['context_window'],
+                'recommended': model_info['recommended'],
+                'tier': model_info['tier'],
+                'current': False,
+                'provider': 'openai'
+            })
+        return models
 
-def show_model_options():
-    """Display all available models with their details"""
-    print("📋 Available OpenAI Models:")
-    print("-" * 50)
-    
-    # Get model information
+@lru_cache(maxsize=1)
+def get_provider():
+    """Create the provider used for model information once per session"""
     provider_config = {
         'api_key': 'dummy',  # Just for getting model info
         'model': 'gpt-4o',
@@ -38,29 +46,30 @@ def show_model_options():
     
     # Create provider instance (won't actually connect without real API key)
     try:
-        provider = OpenAIProvider(provider_config)
+        return OpenAIProvider(provider_config)
     except:
         # If API key is missing, we can still show the model info
-        class MockProvider:
-            AVAILABLE_MODELS = OpenAIProvider.AVAILABLE_MODELS
-            
-            def get_available_models(self):
-                models = []
-                for model_key, model_info in self.AVAILABLE_MODELS.items():
-                    models.append({
-                        'name': model_info['name'],
-                        'description': model_info['description'],
-                        'context_window': model_info['context_window'],
-                        'recommended': model_info['recommended'],
-                        'tier': model_info['tier'],
-                        'current': False,
-                        'provider': 'openai'
-                    })
-                return models
-        
-        provider = MockProvider()
+        return MockProvider()
+
+@lru_cache(maxsize=1)
+def get_models() -> List[Dict[str, Any]]:
+    """Get the available model list once per session"""
+    return get_provider().get_available_models()
+
+def print_welcome():
+    """Print welcome message and instructions"""
+    print("🤖 OpenAI Model Selection Tool")
+    print("=" * 50)
+    print("This tool helps you choose the right OpenAI model for contract analysis.")
+    print("Each model has different strengths, costs, and performance characteristics.")
+    print()
+
+def show_model_options():
+    """Display all available models with their details"""
+    print("📋 Available OpenAI Models:")
+    print("-" * 50)
     
-    models = provider.get_available_models()
+    models = get_models()
     
     for i, model in enumerate(models, 1):
         status = "⭐ RECOMMENDED" if model['recommended'] else "  "
@@ -135,17 +144,8 @@ def show_recommendation(model_name: str, preferences: Dict[str, str]):
     """Show the recommended model with explanation"""
     
     # Get model info
-    provider_config = {
-        'api_key': 'dummy',
-        'model': model_name,
-        'timeout': 30,
-        'temperature': 0.1,
-        'max_tokens': 1024
-    }
-    
     try:
-        provider = OpenAIProvider(provider_config)
-        model_info = provider.get_model_info(model_name)
+        model_info = get_provider().get_model_info(model_name)
     except:
         # Fallback to static info
         model_info = OpenAIProvider.AVAILABLE_MODELS.get(model_name, {})
@@ -3,32 +3,28 @@ Pytest configuration and fixtures for Contract Analyzer tests
 """
 
 import pytest
-import tempfile
-import shutil
-import os
-from pathlib import Path
 from unittest.mock import Mock, patch
-import json
 
 # Import test utilities
-from tests import TEST_DATA_DIR, TEST_UPLOAD_DIR, TEST_REPORTS_DIR, TEST_TEMPLATES_DIR
+from tests import TEST_DATA_DIR
 
-# Import application modules (updated for new architecture)
-from app.config.settings import get_config
-from app.core.services.analyzer import ContractAnalyzer
-from app.services.llm.providers.openai import OpenAIProvider
-from app.services.reports.generator import ReportGenerator
-from app.utils.security.validators import SecurityValidator
-from app.config.user_settings import UserSettingsManager
-from app import create_app
+# Application modules are imported inside the fixtures that use them, so
+# collecting tests does not pull in the whole app
+
+
+def pytest_configure(config):
+    """Register markers used by the tests"""
+    # Registered here rather than in pytest.ini/pyproject.toml: pytest.ini
+    # has no [pytest] section, so pytest reads neither file's markers
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keeps tests on one pytest-xdist worker (with --dist=loadgroup)"
+    )
 
 @pytest.fixture(scope="session")
 def test_config():
-    """Test configuration with safe defaults"""
+    """Test configuration with safe defaults; storage folders come from mock_config"""
     return {
-        'UPLOAD_FOLDER': str(TEST_UPLOAD_DIR),
-        'REPORTS_FOLDER': str(TEST_REPORTS_DIR),
-        'TEMPLATES_FOLDER': str(TEST_TEMPLATES_DIR),
         'MAX_CONTENT_LENGTH': 16 * 1024 * 1024,  # 16MB
         'ALLOWED_EXTENSIONS': ['docx'],
         'DEBUG': True,
@@ -46,19 +42,25 @@ def test_config():
     }
 
 @pytest.fixture
-def mock_config(test_config):
+def mock_config(test_config, tmp_path):
     """Mock configuration for testing"""
     # Create a mock config object with the test config attributes
     mock_config_obj = Mock()
     for key, value in test_config.items():
         setattr(mock_config_obj, key.upper(), value)
     
+    # Per-test storage folders; pytest removes tmp_path, so no cleanup pass is needed
+    for key in ('UPLOAD_FOLDER', 'REPORTS_FOLDER', 'TEMPLATES_FOLDER'):
+        folder = tmp_path / key.lower()
+        folder.mkdir()
+        setattr(mock_config_obj, key, str(folder))
+    
     # Patch the new configuration system
     with patch('app.config.settings.get_config') as mock_get_config:
         mock_get_config.return_value = mock_config_obj
         yield mock_config_obj
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_contract_text():
     """Sample contract text for testing"""
     return """
@@ -82,7 +84,7 @@ def sample_contract_text():
     The Consultant agrees to maintain confidentiality of all proprietary information.
     """
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_template_text():
     """Sample template text for testing"""
     return """
@@ -106,7 +108,7 @@ def sample_template_text():
     The Consultant agrees to maintain confidentiality of all proprietary information.
     """
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_changes():
     """Sample changes for testing analysis"""
     return [
@@ -126,7 +128,7 @@ def sample_changes():
         ('insert', '30')
     ]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_analysis_result():
     """Sample analysis result with multi-stakeholder data"""
     return {
@@ -168,6 +170,8 @@ def mock_llm_provider():
 @pytest.fixture
 def mock_openai_provider():
     """Mock OpenAI provider for testing"""
+    from app.services.llm.providers.openai import OpenAIProvider
+    
     provider = Mock(spec=OpenAIProvider)
     provider.check_connection.return_value = True
     provider.get_current_model.return_value = 'gpt-4o'
@@ -177,9 +181,9 @@ def mock_openai_provider():
     provider._generate_response.return_value = '{"explanation": "Test response"}'
     return provider
 
-@pytest.fixture
-def test_docx_file():
-    """Create a test DOCX file"""
+@pytest.fixture(scope="session")
+def test_docx_file(tmp_path_factory):
+    """Create a test DOCX file once per session; tests must not modify it"""
     from docx import Document
     
     doc = Document()
@@ -187,19 +191,14 @@ def test_docx_file():
     doc.add_paragraph('This is a test contract for testing purposes.')
     doc.add_paragraph('It contains sample text that can be analyzed.')
     
-    test_file = TEST_DATA_DIR / 'test_contract.docx'
-    test_file.parent.mkdir(parents=True, exist_ok=True)
+    test_file = tmp_path_factory.mktemp('docx') / 'test_contract.docx'
     doc.save(str(test_file))
     
-    yield test_file
-    
-    # Cleanup
-    if test_file.exists():
-        test_file.unlink()
+    return test_file
 
-@pytest.fixture
-def test_template_file():
-    """Create a test template DOCX file"""
+@pytest.fixture(scope="session")
+def test_template_file(tmp_path_factory):
+    """Create a test template DOCX file once per session; tests must not modify it"""
     from docx import Document
     
     doc = Document()
@@ -207,19 +206,16 @@ def test_template_file():
     doc.add_paragraph('This is a test template for testing purposes.')
     doc.add_paragraph('It contains [PLACEHOLDER] text that should be replaced.')
     
-    test_file = TEST_DATA_DIR / 'test_template.docx'
-    test_file.parent.mkdir(parents=True, exist_ok=True)
+    test_file = tmp_path_factory.mktemp('docx') / 'test_template.docx'
     doc.save(str(test_file))
     
-    yield test_file
-    
-    # Cleanup
-    if test_file.exists():
-        test_file.unlink()
+    return test_file
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def analyzer():
     """Contract analyzer instance"""
+    from app.core.services.analyzer import ContractAnalyzer
+    
     config = {
         'llm_settings': {
             'provider': 'openai',
@@ -230,25 +226,34 @@ def analyzer():
     }
     return ContractAnalyzer(config)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def security_validator():
     """Security validator instance"""
+    from app.utils.security.validators import SecurityValidator
+    
     return SecurityValidator()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_config_manager():
     """User config manager instance"""
+    from app.config.user_settings import UserSettingsManager
+    
     return UserSettingsManager()
 
 @pytest.fixture
-def report_generator():
-    """Report generator instance"""
-    config = {'REPORTS_FOLDER': str(TEST_REPORTS_DIR)}
-    return ReportGenerator(reports_dir=str(TEST_REPORTS_DIR), config=config)
+def report_generator(tmp_path):
+    """Report generator instance writing to a per-test directory"""
+    from app.services.reports.generator import ReportGenerator
+    
+    reports_dir = tmp_path / 'reports'
+    config = {'REPORTS_FOLDER': str(reports_dir)}
+    return ReportGenerator(reports_dir=str(reports_dir), config=config)
 
 @pytest.fixture
 def flask_app(mock_config):
     """Flask application instance for testing"""
+    from app import create_app
+    
     with patch('app.config.settings.get_config') as mock_get_config:
         mock_get_config.return_value = mock_config
         app = create_app('testing')
@@ -260,18 +265,7 @@ def client(flask_app):
     """Flask test client"""
     return flask_app.test_client()
 
-@pytest.fixture(autouse=True)
-def cleanup_after_test():
-    """Cleanup after each test"""
-    yield
-    # Clean up any test files that might have been created
-    for test_dir in [TEST_UPLOAD_DIR, TEST_REPORTS_DIR, TEST_TEMPLATES_DIR]:
-        if test_dir.exists():
-            for file in test_dir.glob('*'):
-                if file.is_file():
-                    file.unlink()
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_file_upload():
     """Mock file upload data"""
     return {
@@ -331,6 +325,77 @@ def sample_analysis_data():
         ]
     }
 
+# Canonical Change instances shared across the session; tests must not mutate them
+@pytest.fixture(scope="session")
+def critical_change():
+    """Critical modification change"""
+    from app.core.models.analysis_result import Change, ChangeClassification, ChangeType
+    
+    return Change(
+        change_id="change_001",
+        change_type=ChangeType.MODIFICATION,
+        classification=ChangeClassification.CRITICAL
+    )
+
+@pytest.fixture(scope="session")
+def significant_change():
+    """Significant modification change"""
+    from app.core.models.analysis_result import Change, ChangeClassification, ChangeType
+    
+    return Change(
+        change_id="change_002",
+        change_type=ChangeType.MODIFICATION,
+        classification=ChangeClassification.SIGNIFICANT
+    )
+
+@pytest.fixture(scope="session")
+def inconsequential_change():
+    """Inconsequential modification change"""
+    from app.core.models.analysis_result import Change, ChangeClassification, ChangeType
+    
+    return Change(
+        change_id="change_003",
+        change_type=ChangeType.MODIFICATION,
+        classification=ChangeClassification.INCONSEQUENTIAL
+    )
+
+@pytest.fixture(scope="session")
+def insertion_change():
+    """Significant insertion change"""
+    from app.core.models.analysis_result import Change, ChangeClassification, ChangeType
+    
+    return Change(
+        change_id="change_004",
+        change_type=ChangeType.INSERTION,
+        classification=ChangeClassification.SIGNIFICANT,
+        inserted_text="This is new text that was added to the document"
+    )
+
+@pytest.fixture(scope="session")
+def deletion_change():
+    """Significant deletion change"""
+    from app.core.models.analysis_result import Change, ChangeClassification, ChangeType
+    
+    return Change(
+        change_id="change_005",
+        change_type=ChangeType.DELETION,
+        classification=ChangeClassification.SIGNIFICANT,
+        deleted_text="This text was removed from the document"
+    )
+
+@pytest.fixture(scope="session")
+def modification_change():
+    """Significant modification change with both texts"""
+    from app.core.models.analysis_result import Change, ChangeClassification, ChangeType
+    
+    return Change(
+        change_id="change_006",
+        change_type=ChangeType.MODIFICATION,
+        classification=ChangeClassification.SIGNIFICANT,
+        deleted_text="old text here",
+        inserted_text="new text here"
+    )
+
 # Test data generators
 def generate_test_contract_text(placeholders=None):
     """Generate test contract text with optional placeholders"""
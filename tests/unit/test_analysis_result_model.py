@@ -2,6 +2,7 @@
 Unit tests for AnalysisResult and Change domain models
 """
 
+import copy
 import pytest
 from datetime import datetime
 
@@ -13,6 +14,85 @@ from app.core.models.analysis_result import (
     create_change_from_diff
 )
 
+# Pure in-memory tests; keep them on one worker so module fixtures are built once
+pytestmark = pytest.mark.xdist_group(name="analysis_models")
+
+# Fixed timestamp shared by all tests; no test asserts on the clock
+TS = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def make_change():
+    """Factory for Change objects with common defaults"""
+    def _make(**overrides):
+        defaults = dict(
+            change_id="change_001",
+            change_type=ChangeType.MODIFICATION,
+            classification=ChangeClassification.SIGNIFICANT
+        )
+        defaults.update(overrides)
+        return Change(**defaults)
+    return _make
+
+
+@pytest.fixture(scope="module")
+def sample_change():
+    """Fully populated Change for serialization round-trips"""
+    return Change(
+        change_id="change_001",
+        change_type=ChangeType.MODIFICATION,
+        classification=ChangeClassification.CRITICAL,
+        deleted_text="old text",
+        inserted_text="new text",
+        explanation="Important change",
+        confidence_score=0.95,
+        risk_impact="High impact change",
+        recommendation="Review immediately"
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_analysis(sample_change):
+    """AnalysisResult with one change for serialization round-trips"""
+    analysis = AnalysisResult(
+        analysis_id="analysis_001",
+        contract_id="contract_001",
+        template_id="template_001",
+        analysis_timestamp=TS,
+        similarity_score=0.85,
+        processing_time_seconds=2.5
+    )
+    analysis.add_change(sample_change)
+    return analysis
+
+
+@pytest.fixture(scope="module")
+def _proto_analysis():
+    """Empty AnalysisResult built once and copied per test"""
+    return AnalysisResult(
+        analysis_id="analysis_001",
+        contract_id="contract_001",
+        template_id="template_001",
+        analysis_timestamp=TS
+    )
+
+
+@pytest.fixture
+def analysis(_proto_analysis):
+    """Fresh empty AnalysisResult; mutable fields are not shared with the prototype"""
+    result = copy.copy(_proto_analysis)
+    result.changes = []
+    result.recommendations = []
+    result.metadata = {}
+    return result
+
+
+@pytest.fixture
+def analysis_with_mixed_changes(analysis, critical_change, significant_change, inconsequential_change):
+    """AnalysisResult holding one change of each classification"""
+    analysis.add_changes([critical_change, significant_change, inconsequential_change])
+    return analysis
+
 
 class TestChange:
     """Test suite for Change model"""
@@ -35,15 +115,20 @@ class TestChange:
         assert change.inserted_text == "new text"
         assert change.explanation == "Text was updated"
 
-    def test_change_validation(self):
+    @pytest.mark.parametrize("overrides,message", [
+        pytest.param({"change_id": ""}, "Change ID is required", id="missing-id"),
+        pytest.param({"change_type": 42}, "Invalid change type", id="bad-type"),
+        pytest.param({"change_type": "unknown"}, "is not a valid ChangeType", id="unknown-type"),
+        pytest.param({"classification": 42}, "Invalid classification", id="bad-classification"),
+        pytest.param(
+            {"classification": "unknown"}, "is not a valid ChangeClassification",
+            id="unknown-classification"
+        )
+    ])
+    def test_change_validation(self, make_change, overrides, message):
         """Test change validation"""
-        # Missing change_id should raise error
-        with pytest.raises(ValueError, match="Change ID is required"):
-            Change(
-                change_id="",
-                change_type=ChangeType.MODIFICATION,
-                classification=ChangeClassification.SIGNIFICANT
-            )
+        with pytest.raises(ValueError, match=message):
+            make_change(**overrides)
 
     def test_change_type_conversion(self):
         """Test automatic conversion of string change types"""
@@ -65,116 +150,44 @@ class TestChange:
         
         assert change.classification == ChangeClassification.CRITICAL
 
-    def test_is_critical(self):
-        """Test is_critical method"""
-        critical_change = Change(
-            change_id="change_001",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.CRITICAL
-        )
-        
-        significant_change = Change(
-            change_id="change_002",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.SIGNIFICANT
-        )
-        
-        assert critical_change.is_critical()
-        assert not significant_change.is_critical()
-
-    def test_is_significant(self):
-        """Test is_significant method"""
-        significant_change = Change(
-            change_id="change_001",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.SIGNIFICANT
-        )
-        
-        critical_change = Change(
-            change_id="change_002",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.CRITICAL
-        )
-        
-        assert significant_change.is_significant()
-        assert not critical_change.is_significant()
+    @pytest.mark.parametrize("fixture_name,expected_critical,expected_significant", [
+        ("critical_change", True, False),
+        ("significant_change", False, True),
+        ("inconsequential_change", False, False)
+    ])
+    def test_classification_predicates(
+        self, request, fixture_name, expected_critical, expected_significant
+    ):
+        """Test is_critical and is_significant methods"""
+        change = request.getfixturevalue(fixture_name)
+        
+        assert change.is_critical() == expected_critical
+        assert change.is_significant() == expected_significant
 
-    def test_is_content_change(self):
+    @pytest.mark.parametrize("deleted_text,inserted_text,expected", [
+        ("old text", "new text", True),
+        ("", "", False)
+    ])
+    def test_is_content_change(self, make_change, deleted_text, inserted_text, expected):
         """Test is_content_change method"""
-        content_change = Change(
-            change_id="change_001",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.SIGNIFICANT,
-            deleted_text="old text",
-            inserted_text="new text"
-        )
-        
-        empty_change = Change(
-            change_id="change_002",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.INCONSEQUENTIAL,
-            deleted_text="",
-            inserted_text=""
-        )
+        change = make_change(deleted_text=deleted_text, inserted_text=inserted_text)
         
-        assert content_change.is_content_change()
-        assert not empty_change.is_content_change()
+        assert change.is_content_change() == expected
 
-    def test_get_change_summary(self):
+    @pytest.mark.parametrize("fixture_name,prefix", [
+        ("insertion_change", "Added:"),
+        ("deletion_change", "Removed:"),
+        ("modification_change", "Changed:")
+    ])
+    def test_get_change_summary(self, request, fixture_name, prefix):
         """Test get_change_summary method"""
-        insertion = Change(
-            change_id="change_001",
-            change_type=ChangeType.INSERTION,
-            classification=ChangeClassification.SIGNIFICANT,
-            inserted_text="This is new text that was added to the document"
-        )
+        change = request.getfixturevalue(fixture_name)
         
-        deletion = Change(
-            change_id="change_002",
-            change_type=ChangeType.DELETION,
-            classification=ChangeClassification.SIGNIFICANT,
-            deleted_text="This text was removed from the document"
-        )
-        
-        modification = Change(
-            change_id="change_003",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.SIGNIFICANT,
-            deleted_text="old text here",
-            inserted_text="new text here"
-        )
-        
-        assert insertion.get_change_summary().startswith("Added:")
-        assert deletion.get_change_summary().startswith("Removed:")
-        assert modification.get_change_summary().startswith("Changed:")
+        assert change.get_change_summary().startswith(prefix)
 
-    def test_to_dict_and_from_dict(self):
+    def test_to_dict_and_from_dict(self, sample_change):
         """Test serialization and deserialization"""
-        change = Change(
-            change_id="change_001",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.CRITICAL,
-            deleted_text="old text",
-            inserted_text="new text",
-            explanation="Important change",
-            confidence_score=0.95,
-            risk_impact="High impact change",
-            recommendation="Review immediately"
-        )
-        
-        # Serialize to dict
-        data = change.to_dict()
-        
-        # Deserialize from dict
-        restored_change = Change.from_dict(data)
-        
-        assert restored_change.change_id == change.change_id
-        assert restored_change.change_type == change.change_type
-        assert restored_change.classification == change.classification
-        assert restored_change.deleted_text == change.deleted_text
-        assert restored_change.inserted_text == change.inserted_text
-        assert restored_change.explanation == change.explanation
-        assert restored_change.confidence_score == change.confidence_score
+        assert Change.from_dict(sample_change.to_dict()) == sample_change
 
 
 class TestAnalysisResult:
@@ -186,7 +199,7 @@ class TestAnalysisResult:
             analysis_id="analysis_001",
             contract_id="contract_001", 
             template_id="template_001",
-            analysis_timestamp=datetime.now(),
+            analysis_timestamp=TS,
             similarity_score=0.85
         )
         
@@ -205,21 +218,13 @@ class TestAnalysisResult:
                 analysis_id="",
                 contract_id="contract_001",
                 template_id="template_001",
-                analysis_timestamp=datetime.now()
+                analysis_timestamp=TS
             )
 
-    def test_add_change(self):
+    def test_add_change(self, analysis, make_change):
         """Test adding changes to analysis result"""
-        analysis = AnalysisResult(
-            analysis_id="analysis_001",
-            contract_id="contract_001",
-            template_id="template_001",
-            analysis_timestamp=datetime.now()
-        )
-        
-        change = Change(
+        change = make_change(
             change_id="change_001",
-            change_type=ChangeType.MODIFICATION,
             classification=ChangeClassification.CRITICAL,
             deleted_text="old",
             inserted_text="new"
@@ -231,112 +236,36 @@ class TestAnalysisResult:
         assert len(analysis.changes) == 1
         assert analysis.overall_risk_level == "HIGH"  # Should be high due to critical change
 
-    def test_get_critical_changes(self):
-        """Test getting critical changes"""
-        analysis = AnalysisResult(
-            analysis_id="analysis_001",
-            contract_id="contract_001",
-            template_id="template_001", 
-            analysis_timestamp=datetime.now()
-        )
-        
-        critical_change = Change(
-            change_id="change_001",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.CRITICAL
-        )
-        
-        significant_change = Change(
-            change_id="change_002",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.SIGNIFICANT
-        )
-        
-        analysis.add_change(critical_change)
-        analysis.add_change(significant_change)
-        
-        critical_changes = analysis.get_critical_changes()
-        assert len(critical_changes) == 1
-        assert critical_changes[0].change_id == "change_001"
-
-    def test_get_significant_changes(self):
-        """Test getting significant changes"""
-        analysis = AnalysisResult(
-            analysis_id="analysis_001",
-            contract_id="contract_001",
-            template_id="template_001",
-            analysis_timestamp=datetime.now()
-        )
-        
-        critical_change = Change(
-            change_id="change_001",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.CRITICAL
-        )
-        
-        significant_change = Change(
-            change_id="change_002",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.SIGNIFICANT
-        )
-        
-        analysis.add_change(critical_change)
-        analysis.add_change(significant_change)
-        
-        significant_changes = analysis.get_significant_changes()
-        assert len(significant_changes) == 1
-        assert significant_changes[0].change_id == "change_002"
+    @pytest.mark.parametrize("method,expected_id", [
+        ("get_critical_changes", "change_001"),
+        ("get_significant_changes", "change_002"),
+        ("get_inconsequential_changes", "change_003")
+    ])
+    def test_get_changes_by_classification(self, analysis_with_mixed_changes, method, expected_id):
+        """Test getting changes filtered by classification"""
+        changes = getattr(analysis_with_mixed_changes, method)()
+        
+        assert len(changes) == 1
+        assert changes[0].change_id == expected_id
 
-    def test_risk_level_calculation(self):
+    @pytest.mark.parametrize("significant_count,critical_count,expected_risk", [
+        (0, 0, "LOW"),      # No changes
+        (3, 0, "MEDIUM"),   # Some significant changes
+        (10, 0, "HIGH"),    # Many significant changes
+        (0, 1, "HIGH")      # Any critical change, regardless of count
+    ])
+    def test_risk_level_calculation(
+        self, analysis, make_change, significant_count, critical_count, expected_risk
+    ):
         """Test automatic risk level calculation"""
-        analysis = AnalysisResult(
-            analysis_id="analysis_001",
-            contract_id="contract_001",
-            template_id="template_001",
-            analysis_timestamp=datetime.now()
-        )
-        
-        # No changes = LOW risk
-        assert analysis.overall_risk_level == "LOW"
-        
-        # Add significant changes = MEDIUM risk
-        for i in range(3):
-            change = Change(
-                change_id=f"change_{i}",
-                change_type=ChangeType.MODIFICATION,
-                classification=ChangeClassification.SIGNIFICANT
-            )
-            analysis.add_change(change)
-        
-        assert analysis.overall_risk_level == "MEDIUM"
-        
-        # Add many significant changes = HIGH risk
-        for i in range(3, 10):
-            change = Change(
-                change_id=f"change_{i}",
-                change_type=ChangeType.MODIFICATION,
-                classification=ChangeClassification.SIGNIFICANT
-            )
-            analysis.add_change(change)
-        
-        assert analysis.overall_risk_level == "HIGH"
-        
-        # Add critical change = HIGH risk (regardless of count)
-        analysis_critical = AnalysisResult(
-            analysis_id="analysis_002",
-            contract_id="contract_001",
-            template_id="template_001",
-            analysis_timestamp=datetime.now()
-        )
-        
-        critical_change = Change(
-            change_id="critical_001",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.CRITICAL
-        )
-        analysis_critical.add_change(critical_change)
-        
-        assert analysis_critical.overall_risk_level == "HIGH"
+        changes = [make_change(change_id=f"change_{i}") for i in range(significant_count)]
+        changes += [
+            make_change(change_id=f"critical_{i}", classification=ChangeClassification.CRITICAL)
+            for i in range(critical_count)
+        ]
+        analysis.add_changes(changes)
+        
+        assert analysis.overall_risk_level == expected_risk
 
     def test_get_similarity_percentage(self):
         """Test get_similarity_percentage method"""
@@ -344,34 +273,22 @@ class TestAnalysisResult:
             analysis_id="analysis_001",
             contract_id="contract_001",
             template_id="template_001",
-            analysis_timestamp=datetime.now(),
+            analysis_timestamp=TS,
             similarity_score=0.8567
         )
         
         assert analysis.get_similarity_percentage() == 85.7
 
-    def test_is_high_risk(self):
+    def test_is_high_risk(self, analysis, critical_change):
         """Test is_high_risk method"""
-        analysis = AnalysisResult(
-            analysis_id="analysis_001",
-            contract_id="contract_001",
-            template_id="template_001",
-            analysis_timestamp=datetime.now()
-        )
-        
         # Add critical change to make it high risk
-        critical_change = Change(
-            change_id="change_001",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.CRITICAL
-        )
         analysis.add_change(critical_change)
         
         assert analysis.is_high_risk()
 
-    def test_get_summary(self):
+    def test_get_summary(self, critical_change, significant_change):
         """Test get_summary method"""
-        timestamp = datetime.now()
+        timestamp = TS
         analysis = AnalysisResult(
             analysis_id="analysis_001",
             contract_id="contract_001",
@@ -383,16 +300,6 @@ class TestAnalysisResult:
         )
         
         # Add some changes
-        critical_change = Change(
-            change_id="change_001",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.CRITICAL
-        )
-        significant_change = Change(
-            change_id="change_002",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.SIGNIFICANT
-        )
         analysis.add_change(critical_change)
         analysis.add_change(significant_change)
         
@@ -410,40 +317,9 @@ class TestAnalysisResult:
         assert summary["processing_time"] == 2.5
         assert summary["model_used"] == "gpt-4o"
 
-    def test_to_dict_and_from_dict(self):
+    def test_to_dict_and_from_dict(self, sample_analysis):
         """Test serialization and deserialization"""
-        timestamp = datetime.now()
-        analysis = AnalysisResult(
-            analysis_id="analysis_001",
-            contract_id="contract_001",
-            template_id="template_001",
-            analysis_timestamp=timestamp,
-            similarity_score=0.85,
-            processing_time_seconds=2.5
-        )
-        
-        # Add a change
-        change = Change(
-            change_id="change_001",
-            change_type=ChangeType.MODIFICATION,
-            classification=ChangeClassification.CRITICAL,
-            explanation="Test change"
-        )
-        analysis.add_change(change)
-        
-        # Serialize to dict
-        data = analysis.to_dict()
-        
-        # Deserialize from dict
-        restored_analysis = AnalysisResult.from_dict(data)
-        
-        assert restored_analysis.analysis_id == analysis.analysis_id
-        assert restored_analysis.contract_id == analysis.contract_id
-        assert restored_analysis.template_id == analysis.template_id
-        assert restored_analysis.similarity_score == analysis.similarity_score
-        assert restored_analysis.total_changes == analysis.total_changes
-        assert len(restored_analysis.changes) == len(analysis.changes)
-        assert restored_analysis.changes[0].change_id == analysis.changes[0].change_id
+        assert AnalysisResult.from_dict(sample_analysis.to_dict()) == sample_analysis
 
 
 class TestCreateChangeFromDiff:
@@ -466,28 +342,20 @@ class TestCreateChangeFromDiff:
         assert change.inserted_text == "new text"
         assert change.explanation == "Text was modified"
 
-    def test_create_insertion_change(self):
-        """Test creating an insertion change"""
-        change = create_change_from_diff(
-            change_id="change_001",
-            deleted_text="",
-            inserted_text="new text",
-            explanation="Text was added"
-        )
-        
-        assert change.change_type == ChangeType.INSERTION
-        assert change.inserted_text == "new text"
-        assert change.deleted_text == ""
-
-    def test_create_deletion_change(self):
-        """Test creating a deletion change"""
+    @pytest.mark.parametrize("deleted_text,inserted_text,expected_type", [
+        ("old text", "new text", ChangeType.MODIFICATION),
+        ("", "new text", ChangeType.INSERTION),
+        ("old text", "", ChangeType.DELETION),
+        ("", "", ChangeType.MODIFICATION)
+    ])
+    def test_change_type_detection(self, deleted_text, inserted_text, expected_type):
+        """Test change type is derived from the deleted and inserted text"""
         change = create_change_from_diff(
             change_id="change_001",
-            deleted_text="old text",
-            inserted_text="",
-            explanation="Text was removed"
+            deleted_text=deleted_text,
+            inserted_text=inserted_text
         )
         
-        assert change.change_type == ChangeType.DELETION
-        assert change.deleted_text == "old text"
-        assert change.inserted_text == ""
\ No newline at end of file
+        assert change.change_type == expected_type
+        assert change.deleted_text == deleted_text
+        assert change.inserted_text == inserted_text
\ No newline at end of file
@@ -4,6 +4,7 @@ Unit tests for ComparisonEngine service
 
 import pytest
 from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
 
 from app.core.services.comparison_engine import ComparisonEngine
@@ -62,6 +63,18 @@ class TestComparisonEngine:
         assert len(changes) > 0
         assert any(op == 'delete' for op, _ in changes)
 
+    def test_find_changes_line_operations(self):
+        """Test that find_changes emits bare lines straight from the diff opcodes"""
+        engine = ComparisonEngine()
+
+        changes = engine.find_changes("Line 1\nLine 2\nLine 3", "Line 1\nLine two\nLine 3\nLine 4")
+
+        assert changes == [
+            ('delete', 'Line 2'),
+            ('insert', 'Line two'),
+            ('insert', 'Line 4')
+        ]
+
     def test_calculate_similarity_identical(self):
         """Test similarity calculation with identical texts"""
         engine = ComparisonEngine()
@@ -92,6 +105,46 @@ class TestComparisonEngine:
         
         assert 0.5 <= similarity <= 1.0
 
+    def test_calculate_similarity_cutoff(self):
+        """Test that pairs whose upper bound misses the cutoff short-circuit to 0.0"""
+        engine = ComparisonEngine()
+
+        text1 = "Short text"
+        text2 = "A considerably longer piece of text that shares little with the first"
+
+        assert engine.calculate_similarity(text1, text2, cutoff=0.9) == 0.0
+
+        # A cutoff the pair can meet returns the full ratio
+        similar = engine.calculate_similarity("This is the original text", "This is the original content", cutoff=0.5)
+        assert similar == SequenceMatcher(None, "This is the original text", "This is the original content").ratio()
+
+    def test_calculate_similarity_reused_matcher(self):
+        """Test a caller-owned matcher reused against one text gives per-call results"""
+        engine = ComparisonEngine()
+        contract = "The supplier shall deliver the services described in this statement of work"
+        templates = [
+            "The supplier shall deliver the services described in this change order",
+            "The vendor shall provide the goods listed in the schedule",
+            contract,
+            ""
+        ]
+        
+        matcher = SequenceMatcher(None)
+        reused = [engine.calculate_similarity(t, contract, matcher=matcher) for t in templates]
+        
+        assert reused == [engine.calculate_similarity(t, contract) for t in templates]
+
+    def test_calculate_similarity_shared_between_threads(self):
+        """Test one engine gives the same similarities when called from several threads"""
+        engine = ComparisonEngine()
+        pairs = [(f"clause {i} of the agreement", f"clause {i * 7} of the contract") for i in range(200)]
+        expected = [engine.calculate_similarity(a, b) for a, b in pairs]
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda pair: engine.calculate_similarity(*pair), pairs))
+        
+        assert results == expected
+
     def test_calculate_similarity_empty(self):
         """Test similarity calculation with empty texts"""
         engine = ComparisonEngine()
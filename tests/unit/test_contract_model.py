@@ -9,6 +9,27 @@ from pathlib import Path
 from app.core.models.contract import Contract, validate_contract_file
 
 
+# Analysis results shared by the tests that mark a contract analyzed
+ANALYSIS = dict(
+    template_used="template.docx",
+    changes_count=5,
+    similarity_score=0.85,
+    risk_level="MEDIUM"
+)
+
+
+@pytest.fixture
+def base_contract():
+    """Freshly uploaded contract; function-scoped because tests mutate it"""
+    return Contract.create_from_upload(
+        contract_id="test_001",
+        filename="test.docx",
+        original_filename="My Contract.docx",
+        file_path="/test/path.docx",
+        file_size=1024
+    )
+
+
 class TestContract:
     """Test suite for Contract model"""
 
@@ -54,144 +75,54 @@ class TestContract:
                 upload_timestamp=datetime.now()
             )
 
-    def test_mark_processing(self):
-        """Test marking contract as processing"""
-        contract = Contract.create_from_upload(
-            contract_id="test_001",
-            filename="test.docx",
-            original_filename="test.docx",
-            file_path="/test/path.docx",
-            file_size=1024
-        )
-        
-        contract.mark_processing()
-        assert contract.status == "processing"
-
-    def test_mark_analyzed(self):
-        """Test marking contract as analyzed"""
-        contract = Contract.create_from_upload(
-            contract_id="test_001",
-            filename="test.docx",
-            original_filename="test.docx",
-            file_path="/test/path.docx",
-            file_size=1024
-        )
-        
-        contract.mark_analyzed(
-            template_used="template.docx",
-            changes_count=5,
-            similarity_score=0.85,
-            risk_level="MEDIUM"
-        )
-        
-        assert contract.status == "analyzed"
-        assert contract.template_used == "template.docx"
-        assert contract.changes_count == 5
-        assert contract.similarity_score == 0.85
-        assert contract.risk_level == "MEDIUM"
-        assert isinstance(contract.analysis_timestamp, datetime)
-
-    def test_mark_error(self):
+    @pytest.mark.parametrize("action,kwargs,expected_status,analyzed,high_risk", [
+        (None, {}, "uploaded", False, False),
+        ("mark_processing", {}, "processing", False, False),
+        ("mark_analyzed", ANALYSIS, "analyzed", True, False),
+        ("mark_analyzed", dict(ANALYSIS, risk_level="HIGH"), "analyzed", True, True),
+        ("mark_error", {"error_message": "Test error message"}, "error", False, False)
+    ])
+    def test_state_transitions(
+        self, base_contract, action, kwargs, expected_status, analyzed, high_risk
+    ):
+        """Test status changes and the is_analyzed/is_high_risk predicates"""
+        if action:
+            getattr(base_contract, action)(**kwargs)
+        
+        assert base_contract.status == expected_status
+        assert base_contract.is_analyzed() == analyzed
+        assert base_contract.is_high_risk() == high_risk
+
+    def test_mark_analyzed(self, base_contract):
+        """Test marking contract as analyzed records the results"""
+        base_contract.mark_analyzed(**ANALYSIS)
+        
+        assert base_contract.template_used == "template.docx"
+        assert base_contract.changes_count == 5
+        assert base_contract.similarity_score == 0.85
+        assert base_contract.risk_level == "MEDIUM"
+        assert isinstance(base_contract.analysis_timestamp, datetime)
+
+    def test_mark_error(self, base_contract):
         """Test marking contract with error"""
-        contract = Contract.create_from_upload(
-            contract_id="test_001",
-            filename="test.docx",
-            original_filename="test.docx",
-            file_path="/test/path.docx",
-            file_size=1024
-        )
-        
-        contract.mark_error("Test error message")
-        
-        assert contract.status == "error"
-        assert contract.metadata["error_message"] == "Test error message"
-        assert "error_timestamp" in contract.metadata
-
-    def test_is_analyzed(self):
-        """Test is_analyzed method"""
-        contract = Contract.create_from_upload(
-            contract_id="test_001",
-            filename="test.docx",
-            original_filename="test.docx",
-            file_path="/test/path.docx",
-            file_size=1024
-        )
-        
-        assert not contract.is_analyzed()
-        
-        contract.mark_analyzed(
-            template_used="template.docx",
-            changes_count=5,
-            similarity_score=0.85,
-            risk_level="LOW"
-        )
-        
-        assert contract.is_analyzed()
-
-    def test_is_high_risk(self):
-        """Test is_high_risk method"""
-        contract = Contract.create_from_upload(
-            contract_id="test_001",
-            filename="test.docx",
-            original_filename="test.docx",
-            file_path="/test/path.docx",
-            file_size=1024
-        )
-        
-        contract.mark_analyzed(
-            template_used="template.docx",
-            changes_count=5,
-            similarity_score=0.85,
-            risk_level="HIGH"
-        )
-        
-        assert contract.is_high_risk()
+        base_contract.mark_error("Test error message")
         
-        contract.risk_level = "LOW"
-        assert not contract.is_high_risk()
+        assert base_contract.metadata["error_message"] == "Test error message"
+        assert "error_timestamp" in base_contract.metadata
 
-    def test_get_file_extension(self):
+    def test_get_file_extension(self, base_contract):
         """Test get_file_extension method"""
-        contract = Contract.create_from_upload(
-            contract_id="test_001",
-            filename="test.docx",
-            original_filename="test.docx",
-            file_path="/test/path.docx",
-            file_size=1024
-        )
-        
-        assert contract.get_file_extension() == ".docx"
+        assert base_contract.get_file_extension() == ".docx"
 
-    def test_get_display_name(self):
+    def test_get_display_name(self, base_contract):
         """Test get_display_name method"""
-        contract = Contract.create_from_upload(
-            contract_id="test_001",
-            filename="hashed_filename.docx",
-            original_filename="My Contract.docx",
-            file_path="/test/path.docx",
-            file_size=1024
-        )
-        
-        assert contract.get_display_name() == "My Contract.docx"
+        assert base_contract.get_display_name() == "My Contract.docx"
 
-    def test_get_summary(self):
+    def test_get_summary(self, base_contract):
         """Test get_summary method"""
-        contract = Contract.create_from_upload(
-            contract_id="test_001",
-            filename="test.docx",
-            original_filename="My Contract.docx",
-            file_path="/test/path.docx",
-            file_size=1024
-        )
+        base_contract.mark_analyzed(**ANALYSIS)
         
-        contract.mark_analyzed(
-            template_used="template.docx",
-            changes_count=5,
-            similarity_score=0.85,
-            risk_level="MEDIUM"
-        )
-        
-        summary = contract.get_summary()
+        summary = base_contract.get_summary()
         
         assert summary["id"] == "test_001"
         assert summary["filename"] == "My Contract.docx"
@@ -202,35 +133,22 @@ class TestContract:
         assert "upload_date" in summary
         assert "analysis_date" in summary
 
-    def test_to_dict_and_from_dict(self):
+    def test_to_dict_and_from_dict(self, base_contract):
         """Test serialization and deserialization"""
-        contract = Contract.create_from_upload(
-            contract_id="test_001",
-            filename="test.docx",
-            original_filename="My Contract.docx",
-            file_path="/test/path.docx",
-            file_size=1024
-        )
-        
-        contract.mark_analyzed(
-            template_used="template.docx",
-            changes_count=5,
-            similarity_score=0.85,
-            risk_level="HIGH"
-        )
+        base_contract.mark_analyzed(**dict(ANALYSIS, risk_level="HIGH"))
         
         # Serialize to dict
-        data = contract.to_dict()
+        data = base_contract.to_dict()
         
         # Deserialize from dict
         restored_contract = Contract.from_dict(data)
         
-        assert restored_contract.id == contract.id
-        assert restored_contract.filename == contract.filename
-        assert restored_contract.status == contract.status
-        assert restored_contract.changes_count == contract.changes_count
-        assert restored_contract.similarity_score == contract.similarity_score
-        assert restored_contract.risk_level == contract.risk_level
+        assert restored_contract.id == base_contract.id
+        assert restored_contract.filename == base_contract.filename
+        assert restored_contract.status == base_contract.status
+        assert restored_contract.changes_count == base_contract.changes_count
+        assert restored_contract.similarity_score == base_contract.similarity_score
+        assert restored_contract.risk_level == base_contract.risk_level
 
 
 class TestValidateContractFile:
@@ -2,6 +2,8 @@
 Unit tests for FileManager service
 """
 
+import errno
+import fnmatch
 import pytest
 import tempfile
 import os
@@ -10,7 +12,8 @@ import json
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 
-from app.services.storage.file_manager import FileManager
+from app.services.storage import file_manager as file_manager_module
+from app.services.storage.file_manager import FileManager, _compile_file_patterns
 
 
 class TestFileManager:
@@ -500,4 +503,269 @@ class TestFileManagerEdgeCases:
             saved_path = manager.save_file(mock_file, "uploads")
             
             # Should handle the error gracefully
-            assert saved_path is None
\ No newline at end of file
+            assert saved_path is None
+
+# The tests below exercise the scandir-based storage API
+
+
+@pytest.fixture
+def storage_manager(tmp_path):
+    """FileManager rooted in a per-test directory"""
+    return FileManager(tmp_path / "storage")
+
+
+def make_file(directory, name, content=b"content", age_days=0):
+    """Create a file, backdating its modification time by age_days"""
+    path = Path(directory) / name
+    path.write_bytes(content)
+    if age_days:
+        timestamp = path.stat().st_mtime - age_days * 86400
+        os.utime(path, (timestamp, timestamp))
+    return path
+
+
+needs_symlinks = pytest.mark.skipif(not hasattr(os, 'symlink') or os.name == 'nt',
+                                    reason="requires POSIX symlinks")
+
+
+class TestFileManagerListing:
+    """Test suite for directory listing and size reporting"""
+
+    def test_list_files_by_type(self, storage_manager):
+        """Test extension filtering and newest-first ordering"""
+        base = storage_manager.base_directory
+        make_file(base, "old.pdf", age_days=2)
+        make_file(base, "new.pdf")
+        make_file(base, "notes.txt")
+        (base / "folder.pdf").mkdir()
+        
+        files = storage_manager.list_files_by_type('.pdf')
+        
+        assert [f['name'] for f in files] == ["new.pdf", "old.pdf"]
+        assert files[0]['extension'] == ".pdf"
+        assert files[0]['size_bytes'] == len(b"content")
+
+    @needs_symlinks
+    def test_list_files_by_type_skips_dangling_symlink(self, storage_manager):
+        """Test a symlink to a missing file does not fail the listing"""
+        base = storage_manager.base_directory
+        make_file(base, "report.pdf")
+        os.symlink(base / "missing.pdf", base / "broken.pdf")
+        
+        files = storage_manager.list_files_by_type('.pdf')
+        
+        assert [f['name'] for f in files] == ["report.pdf"]
+
+    def test_get_directory_size_walks_subdirectories(self, storage_manager):
+        """Test sizes are summed across nested directories"""
+        base = storage_manager.base_directory
+        make_file(base, "a.docx", b"12345")
+        (base / "nested" / "deeper").mkdir(parents=True)
+        make_file(base / "nested" / "deeper", "b.docx", b"123")
+        
+        size = storage_manager.get_directory_size()
+        
+        assert size['total_size_bytes'] == 8
+        assert size['file_count'] == 2
+
+    @needs_symlinks
+    def test_get_directory_size_skips_dangling_symlink(self, storage_manager):
+        """Test a dangling symlink is not counted and does not fail the walk"""
+        base = storage_manager.base_directory
+        make_file(base, "a.docx", b"12345")
+        os.symlink(base / "missing.docx", base / "broken.docx")
+        
+        size = storage_manager.get_directory_size()
+        
+        assert size['file_count'] == 1
+
+    @pytest.mark.skipif(os.name == 'nt' or os.geteuid() == 0,
+                        reason="requires POSIX permissions enforced for the user")
+    def test_get_directory_size_skips_unreadable_subdirectory(self, storage_manager):
+        """Test an unreadable subdirectory is skipped rather than failing the walk"""
+        base = storage_manager.base_directory
+        make_file(base, "a.docx", b"12345")
+        locked = base / "locked"
+        locked.mkdir()
+        make_file(locked, "hidden.docx")
+        locked.chmod(0)
+        
+        try:
+            size = storage_manager.get_directory_size()
+        finally:
+            locked.chmod(0o755)
+        
+        assert size['file_count'] == 1
+
+
+class TestFileManagerArchive:
+    """Test suite for archive_old_files"""
+
+    def test_concurrent_conflicting_names_are_all_kept(self, storage_manager, tmp_path):
+        """Test workers racing for the same conflict suffixes never overwrite each other"""
+        base = storage_manager.base_directory
+        archive = tmp_path / "archive"
+        archive.mkdir()
+        make_file(archive, "report.pdf", b"existing")
+        # Source names collide with each other's conflict suffixes
+        names = ["report.pdf"] + [f"report_{i}.pdf" for i in range(1, 20)]
+        for name in names:
+            make_file(base, name, name.encode(), age_days=100)
+        
+        archived = storage_manager.archive_old_files(str(archive), max_age_days=90)
+        
+        assert archived == len(names)
+        assert list(base.iterdir()) == []
+        contents = sorted(path.read_bytes() for path in archive.iterdir())
+        assert contents == sorted([b"existing"] + [name.encode() for name in names])
+
+    @pytest.mark.parametrize("use_dir_fd", [True, False], ids=["dir-fd", "paths"])
+    def test_name_conflicts_get_numbered_suffixes(self, storage_manager, tmp_path, monkeypatch, use_dir_fd):
+        """Test archived names skip over existing ones and young files stay put"""
+        if not use_dir_fd:
+            # Exercise the path-based branch used where dir_fd is unsupported
+            monkeypatch.setattr(file_manager_module, '_HAS_DIR_FD', False)
+        base = storage_manager.base_directory
+        archive = tmp_path / "archive"
+        archive.mkdir()
+        make_file(archive, "contract.docx", b"first")
+        make_file(archive, "contract_1.docx", b"second")
+        make_file(base, "contract.docx", b"third", age_days=100)
+        make_file(base, "recent.docx", age_days=10)
+        
+        archived = storage_manager.archive_old_files(str(archive), max_age_days=90)
+        
+        assert archived == 1
+        assert (archive / "contract_2.docx").read_bytes() == b"third"
+        assert (archive / "contract.docx").read_bytes() == b"first"
+        assert not (base / "contract.docx").exists()
+        assert (base / "recent.docx").exists()
+
+    def test_cross_device_falls_back_to_copy(self, storage_manager, tmp_path, monkeypatch):
+        """Test archiving copies with metadata when hard links fail with EXDEV"""
+        def link_across_devices(*args, **kwargs):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        
+        monkeypatch.setattr(os, 'link', link_across_devices)
+        base = storage_manager.base_directory
+        archive = tmp_path / "archive"
+        archive.mkdir()
+        make_file(archive, "old.pdf", b"existing")
+        source = make_file(base, "old.pdf", b"archived", age_days=100)
+        mtime = source.stat().st_mtime
+        
+        archived = storage_manager.archive_old_files(str(archive), max_age_days=90)
+        
+        assert archived == 1
+        assert not source.exists()
+        copied = archive / "old_1.pdf"
+        assert copied.read_bytes() == b"archived"
+        assert copied.stat().st_mtime == pytest.approx(mtime)
+        assert (archive / "old.pdf").read_bytes() == b"existing"
+
+    @needs_symlinks
+    def test_symlink_is_archived_as_link(self, storage_manager, tmp_path):
+        """Test a symlink moves into the archive and its target is left alone"""
+        base = storage_manager.base_directory
+        archive = tmp_path / "archive"
+        target = make_file(tmp_path, "target.pdf", b"target", age_days=100)
+        os.symlink(target, base / "link.pdf")
+        
+        archived = storage_manager.archive_old_files(str(archive), max_age_days=90)
+        
+        assert archived == 1
+        assert not os.path.lexists(base / "link.pdf")
+        assert os.readlink(archive / "link.pdf") == str(target)
+        assert target.read_bytes() == b"target"
+
+
+class TestFileManagerCleanup:
+    """Test suite for cleanup_old_files"""
+
+    def test_cleanup_respects_cutoff_and_patterns(self, storage_manager):
+        """Test only old files matching the patterns are removed"""
+        base = storage_manager.base_directory
+        make_file(base, "old.pdf", age_days=40)
+        make_file(base, "old.xlsx", age_days=40)
+        make_file(base, "new.pdf", age_days=10)
+        make_file(base, "old.txt", age_days=40)
+        (base / "folder.pdf").mkdir()
+        
+        removed = storage_manager.cleanup_old_files(max_age_days=30)
+        
+        assert removed == 2
+        assert sorted(path.name for path in base.iterdir()) == ["folder.pdf", "new.pdf", "old.txt"]
+
+    def test_cleanup_with_custom_patterns(self, storage_manager):
+        """Test non-suffix glob patterns select files by name"""
+        base = storage_manager.base_directory
+        make_file(base, "report_2023.pdf", age_days=40)
+        make_file(base, "summary.pdf", age_days=40)
+        
+        removed = storage_manager.cleanup_old_files(max_age_days=30, file_patterns=['report_*.pdf'])
+        
+        assert removed == 1
+        assert [path.name for path in base.iterdir()] == ["summary.pdf"]
+
+
+class TestFileManagerMove:
+    """Test suite for safe_move_file"""
+
+    def test_move_to_file_path(self, storage_manager):
+        """Test moving to a new path creates its parent and replaces nothing else"""
+        base = storage_manager.base_directory
+        source = make_file(base, "draft.docx", b"draft")
+        
+        assert storage_manager.safe_move_file(str(source), str(base / "final" / "contract.docx"))
+        
+        assert not source.exists()
+        assert (base / "final" / "contract.docx").read_bytes() == b"draft"
+
+    def test_move_into_existing_directory(self, storage_manager):
+        """Test a directory destination receives the file under its own name"""
+        base = storage_manager.base_directory
+        (base / "final").mkdir()
+        source = make_file(base, "draft.docx", b"draft")
+        
+        assert storage_manager.safe_move_file(str(source), str(base / "final"))
+        
+        assert not source.exists()
+        assert (base / "final").is_dir()
+        assert (base / "final" / "draft.docx").read_bytes() == b"draft"
+
+    def test_move_into_directory_keeps_existing_file(self, storage_manager):
+        """Test a same-named file inside a directory destination is not overwritten"""
+        base = storage_manager.base_directory
+        (base / "final").mkdir()
+        make_file(base / "final", "draft.docx", b"existing")
+        source = make_file(base, "draft.docx", b"draft")
+        
+        assert not storage_manager.safe_move_file(str(source), str(base / "final"))
+        
+        assert source.read_bytes() == b"draft"
+        assert (base / "final" / "draft.docx").read_bytes() == b"existing"
+
+
+class TestCompileFilePatterns:
+    """Test suite for _compile_file_patterns"""
+
+    @pytest.mark.parametrize("patterns,name,expected", [
+        (['*.xlsx', '*.pdf'], "report.pdf", True),
+        (['*.xlsx', '*.pdf'], "report.docx", False),
+        (['*.xlsx', '*.pdf'], "report.PDF", False),         # Case-sensitive, like POSIX glob
+        (['*.tar.gz'], "backup.tar.gz", True),
+        (['report_*.pdf'], "report_q1.pdf", True),
+        (['report_*.pdf'], "old_report_q1.pdf", False),     # Anchored at the start
+        (['report_?.pdf', '*.xlsx'], "report_1.pdf", True),
+        (['report_?.pdf', '*.xlsx'], "report_10.pdf", False),
+        (['report_?.pdf', '*.xlsx'], "data.xlsx", True),
+        (['[ab]*.pdf'], "a1.pdf", True),
+        (['[ab]*.pdf'], "c1.pdf", False),
+        ([], "report.pdf", False)
+    ])
+    def test_matches_like_fnmatchcase(self, patterns, name, expected):
+        """Test the combined matcher agrees with fnmatch.fnmatchcase"""
+        matches = _compile_file_patterns(patterns)
+        
+        assert matches(name) == expected
+        assert expected == any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Unit tests for logging setup
+"""
+
+import logging
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from app.utils.logging import setup as logging_setup
+from app.utils.logging.setup import setup_logging
+
+
+@pytest.fixture
+def log_config(tmp_path):
+    """Development logging config writing under tmp_path; handlers and flags are restored afterwards"""
+    config = SimpleNamespace(
+        LOG_LEVEL='INFO',
+        LOG_FILE=str(tmp_path / 'logs' / 'app.log'),
+        ENV='development'
+    )
+    flags = {flag: getattr(logging, flag) for flag in logging_setup._RECORD_FIELD_FLAGS}
+    yield config
+    
+    for flag, value in flags.items():
+        setattr(logging, flag, value)
+    logging_setup._stop_queue_listeners()
+    for name in logging_setup._APP_LOGGERS + ('security_audit', 'werkzeug', 'urllib3', 'requests'):
+        logger = logging.getLogger(name)
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+
+
+def read_log(config):
+    """Contents of the configured log file"""
+    with open(config.LOG_FILE, encoding='utf8') as f:
+        return f.read()
+
+
+class TestSetupLogging:
+    """Test suite for setup_logging"""
+
+    def test_records_reach_log_file(self, log_config):
+        """Test queued records are written to the log file"""
+        setup_logging(log_config)
+        
+        logging.getLogger('app.test').info("parent record")
+        logging_setup._stop_queue_listeners()
+        
+        assert "parent record" in read_log(log_config)
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires os.fork")
+    def test_forked_child_records_reach_log_file(self, log_config):
+        """Test a forked child gets its own listener and its records are written"""
+        setup_logging(log_config)
+        
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                logging.getLogger('app.test').info("child record")
+                # Flush the child's listeners the way interpreter exit would
+                logging_setup._stop_queue_listeners()
+                exit_code = 0
+            finally:
+                os._exit(exit_code)
+        
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        
+        logging_setup._stop_queue_listeners()
+        assert "child record" in read_log(log_config)
+
+
+class TestRecordFieldFlags:
+    """Test suite for the process-wide thread/process lookup flags"""
+
+    def test_flags_left_alone_by_default(self, log_config):
+        """Test other handlers can still format process and thread fields"""
+        setup_logging(log_config)
+        
+        record = logging.LogRecord('gunicorn.error', logging.INFO, __file__, 1, "booted", None, None)
+        
+        assert logging.logThreads and logging.logProcesses and logging.logMultiprocessing
+        assert logging.Formatter('[%(process)d] [%(thread)d] %(message)s').format(record)
+
+    def test_skip_process_info_opt_in(self, log_config):
+        """Test the flags are cleared only for fields no configured format uses"""
+        log_config.LOG_SKIP_PROCESS_INFO = True
+        log_config.LOG_FORMAT = '%(asctime)s [%(process)d] %(message)s'
+        
+        setup_logging(log_config)
+        
+        assert logging.logProcesses
+        assert not logging.logThreads
+        assert not logging.logMultiprocessing
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""
+Unit tests for Myers diff opcodes
+"""
+
+import random
+import pytest
+from difflib import SequenceMatcher
+
+from app.core.services.myers import myers_opcodes
+
+
+def apply_opcodes(a, b, opcodes):
+    """Rebuild b from a and opcodes, checking equal blocks really match"""
+    result = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == 'equal':
+            assert a[i1:i2] == b[j1:j2]
+            result.extend(a[i1:i2])
+        else:
+            result.extend(b[j1:j2])
+    return result
+
+
+def edit_count(opcodes):
+    """Number of deleted plus inserted elements"""
+    return sum((i2 - i1) + (j2 - j1) for tag, i1, i2, j1, j2 in opcodes if tag != 'equal')
+
+
+class TestMyersOpcodes:
+    """Test suite for myers_opcodes"""
+
+    @pytest.mark.parametrize("a,b,expected", [
+        ("", "", []),
+        ("abc", "abc", [('equal', 0, 3, 0, 3)]),
+        ("", "ab", [('insert', 0, 0, 0, 2)]),
+        ("ab", "", [('delete', 0, 2, 0, 0)]),
+        ("abc", "abxc", [('equal', 0, 2, 0, 2), ('insert', 2, 2, 2, 3), ('equal', 2, 3, 3, 4)]),
+        ("abc", "axc", [('equal', 0, 1, 0, 1), ('replace', 1, 2, 1, 2), ('equal', 2, 3, 2, 3)])
+    ])
+    def test_simple_cases(self, a, b, expected):
+        """Test opcodes for small hand-checked inputs"""
+        assert myers_opcodes(list(a), list(b)) == expected
+
+    def test_random_sequences(self):
+        """Test opcodes rebuild the target with a minimal number of edits"""
+        rng = random.Random(0)
+        for _ in range(500):
+            a = [rng.choice("abc") for _ in range(rng.randint(0, 10))]
+            b = [rng.choice("abc") for _ in range(rng.randint(0, 10))]
+            opcodes = myers_opcodes(a, b)
+
+            assert apply_opcodes(a, b, opcodes) == b
+
+            # Opcodes must tile both sequences without gaps
+            i = j = 0
+            for tag, i1, i2, j1, j2 in opcodes:
+                assert (i1, j1) == (i, j)
+                i, j = i2, j2
+            assert (i, j) == (len(a), len(b))
+
+            # Never more edits than SequenceMatcher finds
+            matcher = SequenceMatcher(None, a, b, autojunk=False)
+            assert edit_count(opcodes) <= edit_count(matcher.get_opcodes())
+
+    def test_max_edits(self):
+        """Test giving up once the edit distance exceeds the bound"""
+        assert myers_opcodes(list("abc"), list("xyz"), max_edits=5) is None
+        assert myers_opcodes(list("abc"), list("xyz"), max_edits=6) is not None
+
+    @pytest.mark.parametrize("a,b", [
+        ("", "abcdef"),
+        ("abcdef", ""),
+        ("xy", "xabcdefy"),
+        ("xabcdefy", "xy")
+    ])
+    def test_max_edits_pure_insert_or_delete(self, a, b):
+        """Test the bound also applies when one side is empty after trimming"""
+        assert myers_opcodes(list(a), list(b), max_edits=5) is None
+        assert myers_opcodes(list(a), list(b), max_edits=6) is not None
+
+    def test_long_similar_documents(self):
+        """Test line diffs of long documents with a few edits"""
+        lines1 = [f"Clause {i}: the parties agree to term {i}" for i in range(3000)]
+        lines2 = list(lines1)
+        lines2[10] = "Clause 10: amended"
+        del lines2[1500]
+        lines2.insert(2500, "Clause 2500a: new obligation")
+
+        opcodes = myers_opcodes(lines1, lines2, max_edits=200)
+
+        assert apply_opcodes(lines1, lines2, opcodes) == lines2
+        assert edit_count(opcodes) == 4
\ No newline at end of file
@@ -0,0 +1,159 @@
+"""
+Unit tests for security validators
+"""
+
+import hashlib
+import io
+import os
+from types import SimpleNamespace
+
+import pytest
+from werkzeug.datastructures import FileStorage
+
+from app.utils.security import validators as validators_module
+from app.utils.security.validators import (
+    SecurityValidator,
+    FileValidationError,
+    PathTraversalError
+)
+
+
+@pytest.fixture(scope="module")
+def validator():
+    """Validator with default settings; no application config is loaded"""
+    return SecurityValidator(SimpleNamespace(ALLOWED_EXTENSIONS=['docx']))
+
+
+class TestValidateFilename:
+    """Test suite for filename validation"""
+
+    @pytest.mark.parametrize("filename,expected", [
+        ("contract.docx", "contract.docx"),
+        ("Contract Draft.DOCX", "Contract_Draft.DOCX"),
+        ("vendor-sow_v2.docx", "vendor-sow_v2.docx")
+    ])
+    def test_valid_filenames(self, validator, filename, expected):
+        """Test allowed names pass and are sanitized"""
+        assert validator.validate_filename(filename) == expected
+
+    @pytest.mark.parametrize("filename,message", [
+        pytest.param("", "cannot be empty", id="empty"),
+        pytest.param("a" * 251 + ".docx", "too long", id="too-long"),
+        pytest.param("../contract.docx", "dangerous pattern", id="traversal-start"),
+        pytest.param("dir/../contract.docx", "dangerous pattern", id="traversal-middle"),
+        pytest.param("dir\\..\\contract.docx", "dangerous pattern", id="traversal-backslash"),
+        pytest.param(".hidden.docx", "dangerous pattern", id="hidden"),
+        pytest.param(" contract.docx", "dangerous pattern", id="leading-space"),
+        pytest.param("contract.docx\t", "dangerous pattern", id="trailing-tab"),
+        pytest.param("con<tract>.docx", "dangerous pattern", id="windows-forbidden"),
+        pytest.param("contract\x00.docx", "dangerous pattern", id="control-char"),
+        pytest.param("contract\x85.docx", "dangerous pattern", id="c1-control-char"),
+        pytest.param("invoice.exe", "suspicious extension", id="exe"),
+        pytest.param("INVOICE.EXE", "suspicious extension", id="exe-uppercase"),
+        pytest.param("contract.docx.js", "suspicious extension", id="double-extension"),
+        pytest.param("contract", "must have an extension", id="no-extension"),
+        pytest.param("contract.pdf", "not allowed", id="disallowed-extension")
+    ])
+    def test_rejected_filenames(self, validator, filename, message):
+        """Test dangerous, suspicious and disallowed names are rejected"""
+        with pytest.raises(FileValidationError, match=message):
+            validator.validate_filename(filename)
+
+
+class TestValidatePath:
+    """Test suite for path traversal protection"""
+
+    @pytest.fixture
+    def uploads(self, tmp_path):
+        """Upload directory with a sibling whose name shares its prefix"""
+        (tmp_path / "uploads" / "nested").mkdir(parents=True)
+        (tmp_path / "uploads2").mkdir()
+        return tmp_path / "uploads"
+
+    @pytest.mark.parametrize("file_path,expected", [
+        ("contract.docx", "contract.docx"),
+        ("nested/contract.docx", os.path.join("nested", "contract.docx")),
+        ("nested/../contract.docx", "contract.docx")
+    ])
+    def test_paths_inside_base(self, validator, uploads, file_path, expected):
+        """Test paths that stay inside the base directory resolve under it"""
+        result = validator.validate_path(file_path, str(uploads))
+        
+        assert result == str(uploads.resolve() / expected)
+
+    @pytest.mark.parametrize("file_path", [
+        pytest.param("../secret.docx", id="parent"),
+        pytest.param("../uploads2/contract.docx", id="prefix-sibling"),
+        pytest.param("nested/../../uploads2/contract.docx", id="prefix-sibling-nested"),
+        pytest.param("/etc/passwd", id="absolute")
+    ])
+    def test_paths_outside_base(self, validator, uploads, file_path):
+        """Test paths resolving outside the base directory are rejected"""
+        with pytest.raises(PathTraversalError):
+            validator.validate_path(file_path, str(uploads))
+
+    @pytest.mark.skipif(os.name == 'nt', reason="requires POSIX symlinks")
+    def test_symlink_escape(self, validator, uploads):
+        """Test a symlink inside the base that points outside it is rejected"""
+        os.symlink(uploads.parent / "uploads2", uploads / "escape")
+        
+        with pytest.raises(PathTraversalError):
+            validator.validate_path("escape/contract.docx", str(uploads))
+
+    @pytest.mark.skipif(os.name == 'nt', reason="requires POSIX symlinks")
+    def test_symlink_within_base(self, validator, uploads):
+        """Test a symlink that stays inside the base is accepted"""
+        os.symlink(uploads / "nested", uploads / "alias")
+        
+        result = validator.validate_path("alias/contract.docx", str(uploads))
+        
+        assert result == str(uploads.resolve() / "nested" / "contract.docx")
+
+    def test_protection_disabled(self, uploads):
+        """Test paths are returned unchanged when protection is turned off"""
+        validator = SecurityValidator(SimpleNamespace(PATH_TRAVERSAL_PROTECTION=False))
+        
+        assert validator.validate_path("../secret.docx", str(uploads)) == "../secret.docx"
+
+
+class _ReadOnlyStream:
+    """Binary stream offering only read() and seek(), without readinto()"""
+
+    def __init__(self, data):
+        self._buffer = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._buffer.read(size)
+
+    def seek(self, offset, whence=0):
+        return self._buffer.seek(offset, whence)
+
+    def tell(self):
+        return self._buffer.tell()
+
+
+class TestCalculateFileHash:
+    """Test suite for file content hashing"""
+
+    DATA = b"PK\x03\x04" + bytes(range(256)) * 64
+
+    @pytest.mark.parametrize("has_file_digest", [
+        pytest.param(True, id="file-digest", marks=pytest.mark.skipif(
+            not hasattr(hashlib, 'file_digest'), reason="requires hashlib.file_digest")),
+        pytest.param(False, id="chunked")
+    ])
+    @pytest.mark.parametrize("make_stream", [
+        pytest.param(io.BytesIO, id="bytesio"),
+        pytest.param(_ReadOnlyStream, id="read-only")
+    ])
+    def test_hash_matches_content(self, validator, monkeypatch, has_file_digest, make_stream):
+        """Test every stream type hashes to the content's SHA-256 and is rewound"""
+        monkeypatch.setattr(validators_module, 'HAS_FILE_DIGEST', has_file_digest)
+        file_storage = FileStorage(stream=make_stream(self.DATA), filename="contract.docx")
+        head = self.DATA[:16]
+        file_storage.seek(len(head))
+        
+        result = validator._calculate_file_hash(file_storage, head)
+        
+        assert result == hashlib.sha256(self.DATA).hexdigest()
+        assert file_storage.stream.tell() == 0
\ No newline at end of file